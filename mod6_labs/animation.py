@@ -0,0 +1,75 @@
+"""Animation policy: how much staged motion WeatherApp plays."""
+
+import asyncio
+from typing import Callable, List
+
+import flet as ft
+
+from update_scheduler import UpdateScheduler
+
+FULL = "full"  # staggered pop-ins and cross-fades
+REDUCED = "reduced"  # one pop-in for everything, no stagger or fades
+NONE = "none"  # final state in a single update, no server-side waits
+MODES = (FULL, REDUCED, NONE)
+
+
+class AnimationPolicy:
+    """Runs reveal and swap transitions according to the configured mode."""
+
+    POP_DELAY = 0.05  # seconds between the start and end frame of a pop-in
+    STAGGER = 0.2  # seconds between controls revealed one after another
+    FADE = 0.3  # seconds a cross-fade stays faded out
+
+    def __init__(self, mode: str, ui_updates: UpdateScheduler):
+        if mode not in MODES:
+            raise ValueError(f"Unknown animation policy {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self.ui_updates = ui_updates
+
+    async def reveal(self, controls: List[ft.Control]):
+        """Bring hidden controls into view."""
+        if self.mode == FULL:
+            for i, control in enumerate(controls):
+                if i:
+                    await asyncio.sleep(self.STAGGER)
+                await self._pop_in([control])
+        elif self.mode == REDUCED:
+            await self._pop_in(controls)
+        else:
+            for control in controls:
+                control.visible = True
+                control.scale = 1.0
+                control.opacity = 1.0
+            self.ui_updates.mark(*controls)
+
+    async def swap(self, controls: List[ft.Control], apply: Callable[[], None]):
+        """Run apply() to change the controls' content, cross-fading in full mode."""
+        if self.mode != FULL:
+            apply()
+            return
+
+        for control in controls:
+            control.opacity = 0
+        self.ui_updates.mark(*controls)
+        await asyncio.sleep(self.FADE)
+
+        apply()
+        for control in controls:
+            control.opacity = 1
+        self.ui_updates.mark(*controls)
+
+    async def _pop_in(self, controls: List[ft.Control]):
+        # Set initial state
+        for control in controls:
+            control.visible = True
+            control.scale = 0.9
+            control.opacity = 0
+        self.ui_updates.mark(*controls)
+
+        await asyncio.sleep(self.POP_DELAY)
+
+        # Trigger animation
+        for control in controls:
+            control.scale = 1.0
+            control.opacity = 1.0
+        self.ui_updates.mark(*controls)
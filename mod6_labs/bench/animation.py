@@ -0,0 +1,77 @@
+"""
+End-to-end search latency under each animation policy.
+
+    python bench/animation.py [searches] [latency_ms]
+
+WeatherApp runs on a headless Flet page against a mock API with the given
+latency. For every mode in animation.MODES, each search is timed from
+perform_search() until its task finishes, and the UI updates and patch
+bytes it sent are counted.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from common import percentiles, report
+
+from tests.support import MockApi, make_page, settle
+
+import main as app_main
+from animation import MODES
+from config import Config
+
+
+async def timed_search(app, city: str) -> float:
+    started = time.perf_counter()
+    app.perform_search(city)
+    await settle()
+    await asyncio.wrap_future(app.searches._future)
+    return time.perf_counter() - started
+
+
+async def main(searches: int, latency_ms: float):
+    Config.DISK_CACHE_ENABLED = False
+    Config.AUTO_REFRESH_ENABLED = False
+    Config.GAZETTEER_PATH = "cities.tsv"
+    Config.HISTORY_SAVE_DELAY = 0.0
+    Config.RATE_LIMIT_BURST = 10 ** 6
+
+    rows = []
+    for mode in MODES:
+        Config.ANIMATION_POLICY = mode
+        page = make_page(asyncio.get_running_loop())
+        conn = page._Page__conn
+        app = app_main.WeatherApp(page)
+        MockApi(delay=latency_ms / 1000).install(app.weather_service)
+
+        latencies, updates, sent = [], [], conn.bytes
+        for i in range(searches):
+            latencies.append(await timed_search(app, f"City {i}"))
+            updates.append(app.ui_updates.per_action["search"])
+        p = percentiles(latencies)
+        rows.append((
+            mode,
+            f"{p[50] * 1000:.0f}",
+            f"{p[99] * 1000:.0f}",
+            f"{sum(updates) / len(updates):.1f}",
+            (conn.bytes - sent) // searches,
+        ))
+        await app.on_page_close(None)
+
+    report(
+        f"{searches} searches per policy, {latency_ms:.0f} ms simulated API latency",
+        rows,
+        ("policy", "p50 ms", "p99 ms", "updates/search", "bytes/search"),
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # keep the history file out of the working tree
+        asyncio.run(main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+            float(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        ))
@@ -0,0 +1,69 @@
+"""
+Batch lookups under API latency: sequential get_weather vs get_weather_many.
+
+    python bench/batch.py [cities] [latency_ms]
+
+The API is an in-process httpx.MockTransport that waits `latency_ms`
+per request, so wall time shows how much of that wait overlaps.
+"""
+
+import asyncio
+import sys
+import time
+
+from common import report
+
+from tests.support import MockApi
+
+from config import Config
+from weather_service import WeatherService
+
+
+async def sequential(service: WeatherService, cities):
+    for city in cities:
+        await service.get_weather(city)
+
+
+async def batched(service: WeatherService, cities, concurrency: int):
+    async for result in service.get_weather_many(cities, concurrency=concurrency):
+        if result.error is not None:
+            raise result.error
+
+
+async def timed(api: MockApi, run) -> tuple:
+    service = WeatherService()
+    api.install(service)
+    before = api.count
+    started = time.perf_counter()
+    try:
+        await run(service)
+    finally:
+        await service.aclose()
+    return (time.perf_counter() - started) * 1000, api.count - before
+
+
+async def main(count: int, latency_ms: float):
+    Config.DISK_CACHE_ENABLED = False
+    Config.RATE_LIMIT_BURST = 10 ** 6
+    api = MockApi(delay=latency_ms / 1000)
+    cities = [f"City {i}" for i in range(count)]
+
+    rows = []
+    elapsed, requests = await timed(api, lambda service: sequential(service, cities))
+    rows.append(("sequential get_weather", "-", requests, f"{elapsed:.0f}"))
+    for concurrency in (1, 5, Config.BATCH_CONCURRENCY, 25):
+        elapsed, requests = await timed(api, lambda service: batched(service, cities, concurrency))
+        rows.append(("get_weather_many", concurrency, requests, f"{elapsed:.0f}"))
+
+    report(
+        f"{count} cities, {latency_ms:.0f} ms simulated API latency",
+        rows,
+        ("lookup", "concurrency", "requests", "wall ms"),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    ))
@@ -0,0 +1,62 @@
+"""
+JSON decode speed of each codec backend on weather and forecast payloads.
+
+    python bench/codec_decode.py
+
+Backends that are not installed are listed as such; codec.loads uses the
+fastest installed one (see codec.BACKEND).
+"""
+
+import importlib
+import json
+import timeit
+
+from common import report
+
+from tests.support import forecast_payload, weather_payload
+
+import codec
+
+
+def decoders():
+    """(name, loads) for every backend codec.py knows, None if not installed."""
+    found = [("json", json.loads)]
+    for name in ("orjson", "msgspec"):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            found.append((name, None))
+            continue
+        found.append((name, module.loads if name == "orjson" else module.json.Decoder().decode))
+    found.append((f"codec.loads ({codec.BACKEND})", codec.loads))
+    return found
+
+
+def per_call_us(func, data: bytes) -> float:
+    timer = timeit.Timer(lambda: func(data))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    payloads = [
+        ("weather", json.dumps(weather_payload("Bench")).encode()),
+        ("forecast, 40 entries", json.dumps(forecast_payload("Bench")).encode()),
+        ("forecast, 10k entries", json.dumps(forecast_payload("Bench", count=10_000)).encode()),
+    ]
+    rows = []
+    for name, loads in decoders():
+        if loads is None:
+            rows.append((name, *["not installed"] * len(payloads)))
+            continue
+        rows.append((name, *(f"{per_call_us(loads, data):.1f}" for _, data in payloads)))
+
+    report(
+        "Decode time, microseconds per payload (best of 5)",
+        rows,
+        ("backend", *(f"{label} ({len(data):,} B)" for label, data in payloads)),
+    )
+
+
+if __name__ == "__main__":
+    main()
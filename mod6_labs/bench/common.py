@@ -0,0 +1,109 @@
+"""
+Shared pieces for the bench scripts: import setup, a local stub API and
+latency percentiles.
+
+Run any script from mod6_labs, e.g. ``python bench/http_pool.py``. No
+network access or API key is needed.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Sequence
+from urllib.parse import parse_qs, urlparse
+
+MODULE_DIR = Path(__file__).resolve().parent.parent
+if str(MODULE_DIR) not in sys.path:
+    sys.path.insert(0, str(MODULE_DIR))
+
+# config.py validates the key at import time
+os.environ.setdefault("OPENWEATHER_API_KEY", "bench-key")
+
+from tests.support import forecast_payload, weather_payload  # noqa: E402
+
+
+class StubApi:
+    """
+    OpenWeatherMap look-alike on 127.0.0.1 that counts requests and TCP
+    connections, optionally sleeping `delay` seconds per request.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+            def setup(self):
+                with stub._lock:
+                    stub.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+                url = urlparse(self.path)
+                city = parse_qs(url.query).get("q", ["X"])[0]
+                body = forecast_payload(city) if url.path.endswith("forecast") else weather_payload(city)
+                content = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+
+
+def percentiles(samples: Sequence[float], points=(50, 99)) -> Dict[int, float]:
+    """Nearest-rank percentiles of `samples`."""
+    ordered = sorted(samples)
+    return {p: ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))] for p in points}
+
+
+def report(title: str, rows: List[Sequence], headers: Sequence[str]):
+    """Print a small aligned table."""
+    table = [list(map(str, headers))] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    print(f"\n{title}")
+    for i, row in enumerate(table):
+        print("  " + "  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+        if i == 0:
+            print("  " + "  ".join("-" * width for width in widths))
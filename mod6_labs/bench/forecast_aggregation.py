@@ -0,0 +1,73 @@
+"""
+Forecast aggregation cost for a 40-entry (5-day/3-hour) and a 10k-entry payload.
+
+    python bench/forecast_aggregation.py
+
+"datetime grouping" is the per-entry strftime bucketing the app used
+before ForecastAggregator; "ForecastAggregator" folds pre-parsed points
+with integer day arithmetic, and "parse + aggregate" adds building the
+Forecast model from the raw payload.
+"""
+
+import timeit
+from collections import defaultdict
+from datetime import datetime
+
+from common import report
+
+from tests.support import forecast_payload
+
+from forecast import ForecastAggregator
+from models import Forecast
+
+START = 1_700_000_000
+STEP = 10800  # the API's 3-hour spacing
+
+
+def datetime_grouping(payload: dict, days: int = 5):
+    """The pre-ForecastAggregator loop from process_and_display_forecast."""
+    daily_groups = defaultdict(lambda: {"temps": [], "icons": [], "dt": 0})
+    for item in payload.get("list", []):
+        ts = item.get("dt")
+        date_str = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+        daily_groups[date_str]["temps"].append(item.get("main", {}).get("temp"))
+        daily_groups[date_str]["icons"].append(item.get("weather", [{}])[0].get("icon"))
+        daily_groups[date_str]["dt"] = ts
+
+    cards = []
+    for date_str in sorted(daily_groups)[:days]:
+        day = daily_groups[date_str]
+        cards.append((date_str, max(day["temps"]), min(day["temps"]), day["icons"][len(day["icons"]) // 2]))
+    return cards
+
+
+def aggregate(forecast: Forecast, days: int = 5):
+    aggregator = ForecastAggregator.for_forecast(forecast)
+    return [(day.weekday, day.high, day.low, day.icon) for day in aggregator.days(days)]
+
+
+def per_call_us(func, *args) -> float:
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    rows = []
+    for entries in (40, 10_000):
+        payload = forecast_payload("Bench", start=START, count=entries, step=STEP, tz=28800)
+        forecast = Forecast.from_payload(payload)
+        legacy = per_call_us(datetime_grouping, payload)
+        folded = per_call_us(aggregate, forecast)
+        parsed = per_call_us(lambda: aggregate(Forecast.from_payload(payload)))
+        rows.append((entries, f"{legacy:.1f}", f"{folded:.1f}", f"{parsed:.1f}", f"{legacy / folded:.1f}x"))
+
+    report(
+        "Forecast aggregation, microseconds per call (best of 5)",
+        rows,
+        ("entries", "datetime grouping", "ForecastAggregator", "parse + aggregate", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Connection reuse and request latency: one pooled client vs a new client per request.
+
+    python bench/http_pool.py [lookups]
+
+Each lookup is a search's weather + forecast pair against a local stub;
+city names are all distinct so no cache hides the network.
+"""
+
+import asyncio
+import sys
+import time
+
+from common import StubApi, percentiles, report
+
+import httpx
+
+from config import Config
+from weather_service import WeatherService
+
+
+async def fresh_client_per_request(stub: StubApi, lookups: int):
+    """What WeatherService did before the shared pool: a client per call."""
+    latencies = []
+    for i in range(lookups):
+        started = time.perf_counter()
+        for path in ("weather", "forecast"):
+            async with httpx.AsyncClient(timeout=Config.TIMEOUT) as client:
+                response = await client.get(f"{stub.base_url}/{path}", params={"q": f"City {i}"})
+                response.json()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def pooled_service(stub: StubApi, lookups: int):
+    latencies = []
+    async with WeatherService() as service:
+        for i in range(lookups):
+            started = time.perf_counter()
+            await asyncio.gather(service.get_weather(f"City {i}"), service.get_forecast(f"City {i}"))
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def main(lookups: int):
+    rows = []
+    with StubApi() as stub:
+        Config.BASE_URL = f"{stub.base_url}/weather"
+        Config.FORECAST_URL = f"{stub.base_url}/forecast"
+        Config.DISK_CACHE_ENABLED = False
+        Config.RATE_LIMIT_BURST = 10 ** 6
+
+        for name, run in (("client per request", fresh_client_per_request), ("shared pool", pooled_service)):
+            stub.reset()
+            latencies = await run(stub, lookups)
+            p = percentiles(latencies)
+            rows.append((name, stub.requests, stub.connections, f"{p[50] * 1000:.2f}", f"{p[99] * 1000:.2f}"))
+
+    report(
+        f"{lookups} lookups (weather + forecast each)",
+        rows,
+        ("client", "requests", "connections", "p50 ms", "p99 ms"),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
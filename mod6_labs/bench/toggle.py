@@ -0,0 +1,79 @@
+"""
+Theme and unit toggle latency on a headless page, after a number of searches.
+
+    python bench/toggle.py [toggles]
+
+WeatherApp runs on an in-process Flet connection and mock API. Each
+toggle is timed until its updates are serialized, and the patch bytes
+it sent are counted. Unit toggles use ANIMATION_POLICY "none" so the
+cross-fade wait is not measured.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from common import percentiles, report
+
+from tests.support import MockApi, make_page, settle
+
+import main as app_main
+from config import Config
+
+
+async def search(app, city: str):
+    app.perform_search(city)
+    await settle()
+    await asyncio.wrap_future(app.searches._future)
+    await settle()
+
+
+async def measure(app, page, toggle, toggles: int):
+    conn = page._Page__conn
+    latencies = []
+    sent = conn.bytes
+    for _ in range(toggles):
+        started = time.perf_counter()
+        result = toggle(None)
+        if asyncio.iscoroutine(result):
+            await result
+        app.ui_updates.flush()
+        latencies.append(time.perf_counter() - started)
+    return latencies, (conn.bytes - sent) // toggles
+
+
+async def main(toggles: int):
+    Config.DISK_CACHE_ENABLED = False
+    Config.AUTO_REFRESH_ENABLED = False
+    Config.ANIMATION_POLICY = "none"
+    Config.GAZETTEER_PATH = "cities.tsv"
+    Config.HISTORY_SAVE_DELAY = 0.0
+    Config.RATE_LIMIT_BURST = 10 ** 6
+
+    rows = []
+    for searches in (1, 20, 100):
+        page = make_page(asyncio.get_running_loop())
+        app = app_main.WeatherApp(page)
+        MockApi().install(app.weather_service)
+        for i in range(searches):
+            await search(app, f"City {i}")
+
+        for name, toggle in (("theme", app.toggle_theme), ("unit", app.toggle_unit)):
+            latencies, patch_bytes = await measure(app, page, toggle, toggles)
+            p = percentiles(latencies)
+            rows.append((searches, name, f"{p[50] * 1000:.2f}", f"{p[99] * 1000:.2f}", patch_bytes))
+        await app.on_page_close(None)
+
+    report(
+        f"Toggle latency ({toggles} toggles each)",
+        rows,
+        ("searches before", "toggle", "p50 ms", "p99 ms", "bytes/toggle"),
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # keep the history file out of the working tree
+        asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,44 @@
+"""JSON codec that prefers a fast optional backend over the standard library."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    try:
+        import msgspec
+        BACKEND = "msgspec"
+    except ImportError:
+        msgspec = None
+        BACKEND = "json"
+
+if BACKEND == "msgspec":
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode JSON; raises ValueError on malformed input for every backend."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes, indented by two spaces if `pretty`."""
+    if BACKEND == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if BACKEND == "msgspec":
+        encoded = _encoder.encode(obj)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -25,12 +25,71 @@ class Config:
     APP_TITLE = "Weather App"
     APP_WIDTH = 430
     APP_HEIGHT = 932
+    FORECAST_DAYS = 5  # forecast cards shown (a fixed, reused pool)
+    HISTORY_SAVE_DELAY = 1.0  # seconds; bursts of searches share one history write
     
     # API Settings
     UNITS = "metric"  # metric, imperial, or standard
     TIMEOUT = 10  # seconds
     IP_API_URL = "https://ipapi.co/json/"
     
+    # Connection Pool Settings
+    HTTP2 = True  # used only when the optional "h2" package is installed
+    MAX_CONNECTIONS = 10
+    MAX_KEEPALIVE_CONNECTIONS = 5
+    KEEPALIVE_EXPIRY = 30  # seconds
+    
+    # Response Cache Settings
+    CACHE_MAX_ENTRIES = 128
+    WEATHER_CACHE_TTL = 600  # seconds (current conditions)
+    FORECAST_CACHE_TTL = 1800  # seconds (5-day forecast)
+    
+    # Persistent Cache Settings
+    DISK_CACHE_ENABLED = True
+    DISK_CACHE_PATH = "weather_cache.db"
+    DISK_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds before compaction drops an entry
+    DISK_CACHE_MAX_ENTRIES = 500
+    STALE_WHILE_REVALIDATE = 3600  # seconds past TTL a stale entry may still be served
+    
+    # Batch Settings
+    BATCH_CONCURRENCY = 10  # max simultaneous lookups in get_weather_many
+    
+    # Retry / Circuit Breaker Settings
+    RETRY_ATTEMPTS = 2  # retries after the first attempt
+    RETRY_BASE_DELAY = 0.5  # seconds
+    RETRY_MAX_DELAY = 4.0  # seconds (also the longest Retry-After we will wait)
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30  # seconds before a half-open trial request
+    
+    # Client-side Rate Limit (shared API key quota)
+    RATE_LIMIT_PER_MINUTE = 60
+    RATE_LIMIT_BURST = 10
+    
+    # Startup Prefetch Settings
+    PREFETCH_HISTORY_COUNT = 5  # history cities warmed after first paint
+    PREFETCH_CONCURRENCY = 2
+    
+    # City Autocomplete Settings
+    GAZETTEER_PATH = "assets/cities.tsv"  # build with: python gazetteer.py cities500.txt assets/cities.tsv
+    AUTOCOMPLETE_LIMIT = 8  # suggestions shown while typing
+    
+    # Live Search Settings
+    LIVE_SEARCH_ENABLED = False  # search while typing (opt-in)
+    LIVE_SEARCH_DEBOUNCE_MS = 500  # quiet time after the last keystroke
+    LIVE_SEARCH_MIN_CHARS = 3
+    
+    # Auto-refresh Settings
+    AUTO_REFRESH_ENABLED = True
+    AUTO_REFRESH_INTERVAL = 600  # seconds between refreshes of the displayed city
+    AUTO_REFRESH_JITTER = 60  # +/- seconds, spreads refreshes across instances
+    
+    # Animation Settings
+    ANIMATION_POLICY = "full"  # full, reduced, or none (no staged waits)
+    
+    # Diagnostics
+    UI_METRICS_ENABLED = False  # log updates/controls/patch bytes per search
+    UI_UPDATE_BUDGET = 8  # warn when one user action sends more updates (0 = off)
+    
     @classmethod
     def validate(cls):
         """Validate that required configuration is present."""
@@ -0,0 +1,45 @@
+"""Trailing-edge debouncing for bursts of UI events."""
+
+import asyncio
+from typing import Any, Callable, Optional, Tuple
+
+
+class Debouncer:
+    """
+    Calls `callback` with the latest arguments once `delay` seconds pass
+    without another trigger().
+
+    trigger() is safe to call from Flet's handler threads; the timer and
+    the callback always run on `loop`.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, delay: float, callback: Callable[..., Any]):
+        self.loop = loop
+        self.delay = delay
+        self.callback = callback
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self.triggered = 0
+        self.fired = 0
+
+    def trigger(self, *args: Any):
+        self.triggered += 1
+        self.loop.call_soon_threadsafe(self._arm, args)
+
+    def cancel(self):
+        self.loop.call_soon_threadsafe(self._disarm)
+
+    def _arm(self, args: Tuple):
+        self._disarm()
+        self._timer = self.loop.call_later(self.delay, self._fire, args)
+
+    def _disarm(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _fire(self, args: Tuple):
+        self._timer = None
+        self.fired += 1
+        self.callback(*args)
@@ -0,0 +1,116 @@
+"""Persistent SQLite store for weather responses."""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import codec
+
+
+class DiskCache:
+    """
+    Stores API payloads with their fetch timestamps so they survive restarts.
+
+    Each thread gets its own connection to a WAL-mode database, so lookups
+    on the event loop keep reading while a worker thread writes or compacts.
+    Nothing heavier than opening the file runs in the constructor; call
+    compact() from a worker thread.
+    """
+
+    def __init__(self, path: str, max_age: float, max_entries: int):
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL lets readers run alongside a writer; NORMAL syncs at checkpoints, not every commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _serialize_key(key: Hashable) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key: Hashable) -> Optional[Tuple[Dict, float]]:
+        """Return (payload, fetched_at) for a key, regardless of age."""
+        row = self.conn.execute(
+            "SELECT payload, fetched_at FROM responses WHERE key = ?",
+            (self._serialize_key(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return codec.loads(row[0]), row[1]
+        except ValueError:
+            return None
+
+    def set(self, key: Hashable, payload: Dict, fetched_at: Optional[float] = None):
+        """Insert or replace the payload stored for a key."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, payload, fetched_at) VALUES (?, ?, ?)",
+            (
+                self._serialize_key(key),
+                codec.dumps(payload),
+                fetched_at if fetched_at is not None else time.time(),
+            )
+        )
+        self.conn.commit()
+
+    def touch(self, key: Hashable):
+        """Mark a stored payload as freshly confirmed (e.g. after a 304)."""
+        self.conn.execute(
+            "UPDATE responses SET fetched_at = ? WHERE key = ?",
+            (time.time(), self._serialize_key(key))
+        )
+        self.conn.commit()
+
+    def compact(self):
+        """Drop entries older than max_age, keep only the newest max_entries and reclaim space."""
+        cursor = self.conn.execute(
+            "DELETE FROM responses WHERE fetched_at < ?",
+            (time.time() - self.max_age,)
+        )
+        removed = cursor.rowcount
+        cursor = self.conn.execute(
+            '''
+            DELETE FROM responses WHERE key NOT IN (
+                SELECT key FROM responses ORDER BY fetched_at DESC LIMIT ?
+            )
+            ''',
+            (self.max_entries,)
+        )
+        removed += cursor.rowcount
+        self.conn.commit()
+
+        if removed:
+            self.conn.execute("VACUUM")
+        return removed
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
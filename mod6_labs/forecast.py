@@ -0,0 +1,75 @@
+"""Incremental aggregation of forecast entries into daily summaries."""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+from models import DailySummary, Forecast, ForecastPoint
+
+SECONDS_PER_DAY = 86400
+
+
+class ForecastAggregator:
+    """
+    Buckets forecast entries by day using integer arithmetic on a UTC offset.
+
+    Entries can be fed one at a time, so payloads of any length (hourly,
+    multi-week) aggregate in memory proportional to the number of days.
+    The offset is fixed for the whole payload, as reported by the API at
+    fetch time; a DST change inside the forecast window is not re-applied.
+    """
+
+    def __init__(self, tz_offset: int = 0):
+        self.tz_offset = tz_offset
+        self._days: Dict[int, DailySummary] = {}
+        self._last: Optional[DailySummary] = None
+
+        # UTC bounds [start, end) of the last bucket, so in-order entries skip the division
+        self._bucket_start = 0
+        self._bucket_end = 0
+
+    @classmethod
+    def for_forecast(cls, forecast: Forecast, fallback_offset: int = 0) -> "ForecastAggregator":
+        """Create an aggregator in the forecast city's timezone and feed it the forecast."""
+        tz_offset = forecast.timezone
+        aggregator = cls(tz_offset if tz_offset is not None else fallback_offset)
+        aggregator.extend(forecast.points)
+        return aggregator
+
+    def day_index(self, ts: float) -> int:
+        return int(ts + self.tz_offset) // SECONDS_PER_DAY
+
+    def today_index(self, now: Optional[float] = None) -> int:
+        return self.day_index(time.time() if now is None else now)
+
+    def add(self, dt: int, temp: Optional[float], icon: Optional[str] = None):
+        """Fold a single reading into its day."""
+        if dt is None or temp is None:
+            return
+
+        # Entries usually arrive in order, so the last bucket is the common hit
+        acc = self._last
+        if acc is None or not (self._bucket_start <= dt < self._bucket_end):
+            day = self.day_index(dt)
+            acc = self._days.get(day)
+            if acc is None:
+                acc = DailySummary(day, dt, temp)
+                self._days[day] = acc
+            self._last = acc
+            self._bucket_start = day * SECONDS_PER_DAY - self.tz_offset
+            self._bucket_end = self._bucket_start + SECONDS_PER_DAY
+        acc.add(temp, icon)
+
+    def add_point(self, point: ForecastPoint):
+        self.add(point.dt, point.temp, point.icon)
+
+    def extend(self, points: Iterable[ForecastPoint]):
+        for point in points:
+            self.add(point.dt, point.temp, point.icon)
+
+    def get(self, day: int) -> Optional[DailySummary]:
+        return self._days.get(day)
+
+    def days(self, limit: Optional[int] = None) -> List[DailySummary]:
+        """Daily aggregates in chronological order."""
+        ordered = [self._days[day] for day in sorted(self._days)]
+        return ordered if limit is None else ordered[:limit]
@@ -0,0 +1,262 @@
+"""
+Local city gazetteer with memory-mapped prefix lookup.
+
+Build the bundled file from a GeoNames dump (https://download.geonames.org/export/dump/):
+
+    python gazetteer.py cities500.txt assets/cities.tsv
+
+This writes assets/cities.tsv and its ranking index, assets/cities.tsv.top.
+"""
+
+import heapq
+import mmap
+import sys
+import unicodedata
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+SCAN_LIMIT = 200  # prefixes matching more cities than this get a precomputed ranking
+TOP_K = 16  # cities kept per ranked prefix, the most complete() returns for one
+
+
+class Place(NamedTuple):
+    name: str
+    country: str
+    lat: float
+    lon: float
+    population: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}, {self.country}" if self.country else self.name
+
+
+def normalize(name: str) -> str:
+    """Lookup key: accents stripped, case folded, whitespace collapsed."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class Gazetteer:
+    """
+    Prefix search over a sorted, tab-separated city file.
+
+    Each line is ``key<TAB>name<TAB>country<TAB>lat<TAB>lon<TAB>population``
+    and lines are sorted by the UTF-8 bytes of ``key`` (see build()). The
+    file is memory-mapped on first use and searched by bisecting on byte
+    offsets, so nothing is parsed or indexed up front and only the pages a
+    lookup touches are read from disk.
+
+    Prefixes shared by more than SCAN_LIMIT cities are ranked by the
+    companion ``.top`` file, whose sorted ``prefix<TAB>offset,offset,...``
+    lines point at their most populous cities, so a short prefix never
+    depends on how many small towns sort ahead of the big one.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.top_path = top_index_path(self.path)
+        self._files = []
+        self._map: Optional[mmap.mmap] = None
+        self._top: Optional[mmap.mmap] = None
+
+    @property
+    def available(self) -> bool:
+        return self._map is not None or self.path.exists()
+
+    def _open(self, path: Path) -> Optional[mmap.mmap]:
+        if not path.exists() or path.stat().st_size == 0:
+            return None
+        f = open(path, "rb")
+        self._files.append(f)
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _data(self) -> Optional[mmap.mmap]:
+        if self._map is None:
+            self._map = self._open(self.path)
+            if self._map is not None:
+                self._top = self._open(self.top_path)
+        return self._map
+
+    def close(self):
+        for data in (self._map, self._top):
+            if data is not None:
+                data.close()
+        for f in self._files:
+            f.close()
+        self._files = []
+        self._map = None
+        self._top = None
+
+    def _line_start(self, data: mmap.mmap, pos: int) -> int:
+        return data.rfind(b"\n", 0, pos) + 1
+
+    def _first_at_or_after(self, data: mmap.mmap, key: bytes) -> int:
+        """Offset of the first line whose key is >= `key`."""
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = self._line_start(data, (lo + hi) // 2)
+            end = data.find(b"\t", mid) + 1  # keep the tab, it sorts below any name character
+            if data[mid:end] < key:
+                next_line = data.find(b"\n", mid)
+                lo = len(data) if next_line < 0 else next_line + 1
+            else:
+                hi = mid
+        return lo
+
+    def _scan(self, data: mmap.mmap, key: bytes, limit: int) -> List[bytes]:
+        """Up to `limit` consecutive lines starting with `key`."""
+        lines = []
+        pos = self._first_at_or_after(data, key)
+        size = len(data)
+        while pos < size and len(lines) < limit:
+            line = self._line_at(data, pos)
+            if not line.startswith(key):
+                break
+            lines.append(line)
+            pos += len(line) + 1
+        return lines
+
+    @staticmethod
+    def _line_at(data: mmap.mmap, pos: int) -> bytes:
+        end = data.find(b"\n", pos)
+        return data[pos:] if end < 0 else data[pos:end]
+
+    def _lines(self, prefix: str, exact: bool, limit: int) -> List[bytes]:
+        """Raw lines whose key starts with (or equals) the normalized prefix."""
+        data = self._data()
+        key = normalize(prefix).encode()
+        if data is None or not key:
+            return []
+        if exact:
+            key += b"\t"
+        return self._scan(data, key, limit)
+
+    def _ranked(self, prefix: str) -> Optional[List[bytes]]:
+        """Precomputed most-populous lines for a busy prefix, or None if it has none."""
+        data = self._data()
+        key = normalize(prefix).encode()
+        if self._top is None or not key:
+            return None
+        found = self._scan(self._top, key + b"\t", 1)
+        if not found:
+            return None
+        offsets = found[0][len(key) + 1:].split(b",")
+        return [self._line_at(data, int(offset)) for offset in offsets]
+
+    @staticmethod
+    def _population(line: bytes) -> int:
+        return int(line[line.rfind(b"\t") + 1:])
+
+    @staticmethod
+    def _place(line: bytes) -> Place:
+        _, name, country, lat, lon, population = line.decode().split("\t")
+        return Place(name, country, float(lat), float(lon), int(population))
+
+    def complete(self, prefix: str, limit: int = 8) -> List[Place]:
+        """Cities whose name starts with `prefix`, most populous first (at most TOP_K)."""
+        lines = self._ranked(prefix)
+        if lines is None:
+            # Not a ranked prefix, so all of its matches fit in one scan
+            lines = self._lines(prefix, exact=False, limit=SCAN_LIMIT)
+            lines.sort(key=self._population, reverse=True)
+        return [self._place(line) for line in lines[:limit]]
+
+    def resolve(self, query: str) -> Optional[Place]:
+        """
+        Best match for a typed name such as "Paris" or "Paris, US".
+
+        Ambiguous names resolve to the most populous city; None means the
+        name is unknown locally and should be left to the API.
+        """
+        name, _, country = query.partition(",")
+        matches = [self._place(line) for line in self._lines(name, exact=True, limit=50)]
+        country = country.strip().upper()
+        if country:
+            matches = [place for place in matches if place.country == country]
+        if not matches:
+            return None
+        return max(matches, key=lambda place: place.population)
+
+
+def top_index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".top")
+
+
+def rank_prefixes(keys: List[bytes], populations: List[int]) -> List[tuple]:
+    """
+    (prefix, row indexes) for every prefix shared by more than SCAN_LIMIT
+    of the sorted keys, with the TOP_K most populous rows of each, sorted
+    by prefix.
+
+    Rows sharing a prefix are contiguous, so each length only splits the
+    ranges that were still too large one byte earlier.
+    """
+    ranked = []
+    ranges = [(0, len(keys))]
+    length = 0
+    while ranges:
+        length += 1
+        busy = []
+        for lo, hi in ranges:
+            i = lo
+            while i < hi:
+                if len(keys[i]) < length:
+                    i += 1
+                    continue
+                prefix = keys[i][:length]
+                j = i + 1
+                while j < hi and keys[j][:length] == prefix:
+                    j += 1
+                if j - i > SCAN_LIMIT:
+                    ranked.append((prefix, heapq.nlargest(TOP_K, range(i, j), key=populations.__getitem__)))
+                    busy.append((i, j))
+                i = j
+        ranges = busy
+    ranked.sort(key=lambda entry: entry[0])
+    return ranked
+
+
+def build(source: Path, target: Path, min_population: int = 0):
+    """
+    Convert a GeoNames cities dump (e.g. cities500.txt) into the sorted
+    gazetteer format, plus the ranking index for busy prefixes.
+    """
+    rows = []
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            fields = line.rstrip("\n").split("\t")
+            name, lat, lon, country = fields[1], fields[4], fields[5], fields[8]
+            population = int(fields[14] or 0)
+            if population < min_population or "\t" in name:
+                continue
+            key = normalize(name)
+            if key:
+                rows.append((key.encode(), f"{key}\t{name}\t{country}\t{lat}\t{lon}\t{population}"))
+
+    rows.sort(key=lambda row: row[0])
+    target.parent.mkdir(parents=True, exist_ok=True)
+    lines = [row.encode() for _, row in rows]
+    with open(target, "wb") as f:
+        f.write(b"\n".join(lines))
+
+    offsets = []
+    pos = 0
+    for line in lines:
+        offsets.append(pos)
+        pos += len(line) + 1
+    keys = [key for key, _ in rows]
+    ranked = rank_prefixes(keys, [Gazetteer._population(line) for line in lines])
+    with open(top_index_path(target), "wb") as f:
+        f.write(b"\n".join(
+            prefix + b"\t" + b",".join(str(offsets[i]).encode() for i in top)
+            for prefix, top in ranked
+        ))
+    print(f"Wrote {len(rows)} cities to {target} ({len(ranked)} ranked prefixes)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        sys.exit("usage: python gazetteer.py <geonames cities.txt> <output.tsv> [min_population]")
+    build(Path(sys.argv[1]), Path(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) == 4 else 0)
@@ -0,0 +1,69 @@
+"""Debounced, atomic persistence of the search history file."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import codec
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file and os.replace so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class HistoryWriter:
+    """
+    Saves the latest history snapshot off the event loop.
+
+    schedule() only records the snapshot; the write happens `delay` seconds
+    later in a worker thread, so a burst of searches costs a single write.
+    Call schedule() from the event loop and await flush() on shutdown.
+    """
+
+    def __init__(self, path: Path, delay: float, loop: asyncio.AbstractEventLoop):
+        self.path = path
+        self.delay = delay
+        self.loop = loop
+        self._pending: Optional[List[str]] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock: Optional[asyncio.Lock] = None  # created on the loop by flush()
+
+        # Statistics
+        self.writes = 0
+        self.coalesced = 0
+
+    def schedule(self, history: List[str]):
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = list(history)
+        if self._timer is None:
+            self._timer = self.loop.call_later(self.delay, self._start_flush)
+
+    def _start_flush(self):
+        self._timer = None
+        self.loop.create_task(self.flush())
+
+    async def flush(self):
+        """Write the pending snapshot now, if there is one."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            history, self._pending = self._pending, None
+            if history is None:
+                return
+            try:
+                await asyncio.to_thread(write_atomic, self.path, codec.dumps(history, pretty=True))
+                self.writes += 1
+            except OSError as e:
+                print(f"History Save Error: {e}")
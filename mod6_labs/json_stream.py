@@ -0,0 +1,77 @@
+"""Incremental extraction of array items from a streamed JSON object."""
+
+import re
+from typing import Any, List, Optional
+
+import codec
+
+QUOTE = ord('"')
+BACKSLASH = ord("\\")
+LBRACE, RBRACE = ord("{"), ord("}")
+LBRACKET, RBRACKET = ord("["), ord("]")
+
+
+class JsonArrayStream:
+    """
+    Yields the items of one top-level array (e.g. the forecast "list") as
+    soon as each item's bytes have arrived.
+
+    Only the item currently being received is buffered, so peak memory is
+    bounded by the size of a single entry rather than the whole payload.
+    Items must be objects or arrays, which holds for OpenWeatherMap lists.
+    """
+
+    def __init__(self, key: str = "list"):
+        self._key_pattern = re.compile(rb'"' + re.escape(key.encode()) + rb'"\s*:\s*$')
+        self._tail_size = len(key) + 32
+        self._tail = bytearray()  # recent top-level bytes, used to spot the key
+        self._item: Optional[bytearray] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._in_array = False
+        self.items_seen = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume the next chunk and return the items it completed."""
+        items = []
+        item_start = 0 if self._item is not None else -1
+
+        for i, c in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == BACKSLASH:
+                    self._escape = True
+                elif c == QUOTE:
+                    self._in_string = False
+            elif c == QUOTE:
+                self._in_string = True
+            elif c == LBRACE or c == LBRACKET:
+                if self._in_array and self._depth == 2:
+                    self._item = bytearray()
+                    item_start = i
+                elif (c == LBRACKET and self._depth == 1 and not self._in_array
+                      and self._key_pattern.search(self._tail)):
+                    self._in_array = True
+                self._depth += 1
+            elif c == RBRACE or c == RBRACKET:
+                self._depth -= 1
+                if self._in_array:
+                    if self._depth == 2 and self._item is not None:
+                        self._item += chunk[item_start:i + 1]
+                        items.append(codec.loads(self._item))
+                        self._item = None
+                        item_start = -1
+                        self.items_seen += 1
+                    elif self._depth == 1:
+                        self._in_array = False
+
+            if self._depth <= 1 and not self._in_array:
+                self._tail.append(c)
+                if len(self._tail) > self._tail_size:
+                    del self._tail[0]
+
+        if self._item is not None:
+            self._item += chunk[item_start:]
+        return items
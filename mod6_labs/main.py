@@ -3,12 +3,26 @@
 
 import flet as ft
 from weather_service import WeatherService
+from prefetch import PrefetchScheduler
+from refresh import RefreshScheduler
+from search_tasks import SearchTaskManager
+from debounce import Debouncer
+from rate_limiter import PRIORITY_BACKGROUND
+import theme_palette
+from theme_registry import ThemeRegistry
+from update_scheduler import UpdateScheduler
+from animation import AnimationPolicy
+from ui_metrics import UIMetrics
 from config import Config
-import json
+import codec
 from pathlib import Path
+from typing import Optional
 import asyncio
-from datetime import datetime
-from collections import defaultdict
+import time
+from forecast import ForecastAggregator
+from gazetteer import Gazetteer, Place
+from history_store import HistoryWriter
+from models import CurrentConditions, Forecast
 import httpx
 
 class WeatherApp:
@@ -17,14 +31,36 @@ class WeatherApp:
     def __init__(self, page: ft.Page):
         self.page = page
         self.weather_service = WeatherService()
+        self.gazetteer = Gazetteer(Path(Config.GAZETTEER_PATH))
+        self.prefetcher = PrefetchScheduler(
+            self.weather_service,
+            limit=Config.PREFETCH_HISTORY_COUNT,
+            concurrency=Config.PREFETCH_CONCURRENCY,
+            gazetteer=self.gazetteer,
+        )
+        self.searches = SearchTaskManager(page)
+        self.live_search = Debouncer(
+            page.loop, Config.LIVE_SEARCH_DEBOUNCE_MS / 1000, self.run_live_search
+        )
+        self.refresher = RefreshScheduler(
+            interval=Config.AUTO_REFRESH_INTERVAL,
+            jitter=Config.AUTO_REFRESH_JITTER,
+            callback=self.refresh_current_city,
+        )
 
         self.history_file = Path("search_history.json")
         self.search_history = self.load_history()
+        self.history_writer = HistoryWriter(
+            self.history_file, delay=Config.HISTORY_SAVE_DELAY, loop=page.loop
+        )
         
         # State Variables
         self.is_celsius = True 
         self.is_dark_mode = False 
         self.current_weather_data = None
+        self.current_forecast_data = None
+        self.current_city = None
+        self.current_place = None  # gazetteer match the current city was fetched by
         self.current_condition_main = "Clear" 
         self.forecast_text_controls = [] 
         
@@ -40,18 +76,14 @@ class WeatherApp:
         # Weather Data Storage
         self.daily_high_c = None
         self.daily_low_c = None
+        self.today_summary = None
         
-        # Theme Management Lists
-        self.card_containers = [] 
-        self.text_elements = []
+        # Theme Management (weakly held, mounted controls only)
+        self.theme_registry = ThemeRegistry()
         
-        # UI Styles
-        self.card_shadow = ft.BoxShadow(
-            blur_radius=10,
-            spread_radius=0,
-            color=ft.Colors.with_opacity(0.08, ft.Colors.BLACK),
-            offset=ft.Offset(0, 4)
-        )
+        # UI Updates (coalesced to one push per event-loop tick)
+        self.ui_updates = UpdateScheduler(page, budget=Config.UI_UPDATE_BUDGET)
+        self.animations = AnimationPolicy(Config.ANIMATION_POLICY, self.ui_updates)
         
         # Geolocator
         self.geolocator = ft.Geolocator(
@@ -59,8 +91,20 @@ class WeatherApp:
         )
         self.page.overlay.append(self.geolocator)
         
+        # Update instrumentation (controls created / patch bytes per search)
+        self.ui_metrics = UIMetrics()
+        if Config.UI_METRICS_ENABLED:
+            self.ui_metrics.attach(self.page)
+        
         self.setup_page()
         self.build_ui()
+        
+        # Paint last-known weather for the most recent search and warm the history.
+        # The top city is included: with nothing cached restore_last_weather paints
+        # nothing, and when it does refresh, single-flight shares the request.
+        if self.search_history:
+            self.page.run_task(self.restore_last_weather)
+            self.page.run_task(self.prefetcher.run, self.search_history)
     
     def setup_page(self):
         """Configure page settings."""
@@ -73,6 +117,30 @@ class WeatherApp:
         self.page.window.height = Config.APP_HEIGHT
         self.page.window.resizable = False
         self.page.window.center()
+        self.page.on_close = self.on_page_close
+        self.page.on_app_lifecycle_state_change = self.on_lifecycle_change
+        self.page.window.on_event = self.on_window_event
+    
+    async def on_page_close(self, e):
+        """Save pending history and release pooled HTTP connections on exit."""
+        self.refresher.cancel()
+        await self.history_writer.flush()
+        await self.weather_service.aclose()
+        self.gazetteer.close()
+
+    def on_lifecycle_change(self, e):
+        """Pause auto-refresh while the app is in the background."""
+        if e.state in (ft.AppLifecycleState.HIDE, ft.AppLifecycleState.PAUSE):
+            self.refresher.paused = True
+        elif e.state in (ft.AppLifecycleState.SHOW, ft.AppLifecycleState.RESUME):
+            self.refresher.paused = False
+
+    def on_window_event(self, e):
+        """Pause auto-refresh while the desktop window is minimized or hidden."""
+        if e.type in (ft.WindowEventType.MINIMIZE, ft.WindowEventType.HIDE):
+            self.refresher.paused = True
+        elif e.type in (ft.WindowEventType.RESTORE, ft.WindowEventType.SHOW):
+            self.refresher.paused = False
     
     # --- Refactored UI Building Methods ---
     
@@ -125,6 +193,7 @@ class WeatherApp:
             
             on_submit=self.on_city_submit,
             on_tap=self.on_city_tap,
+            on_change=self.on_city_change,
             controls=[], 
             expand=True,
         )
@@ -177,6 +246,7 @@ class WeatherApp:
         )
 
         # Text Elements
+        self.weather_icon_image = ft.Image(src=self.weather_icon_url("01d"), width=90, height=90)
         self.main_temp_text = ft.Text("", size=48, weight=ft.FontWeight.BOLD, font_family="Montserrat", color=ft.Colors.WHITE)
         self.feels_like_text = ft.Text("", size=12, weight=ft.FontWeight.W_500, italic=True, font_family="Montserrat", color=ft.Colors.WHITE)
         self.desc_text = ft.Text("", size=12, weight=ft.FontWeight.W_600, italic=True, font_family="Montserrat", color=ft.Colors.WHITE)
@@ -191,6 +261,30 @@ class WeatherApp:
             animate_opacity=300,
         )
 
+        # Built once; searches only mutate values, src and gradient
+        self.weather_container.content = ft.Column(
+            [
+                ft.Row(
+                    [
+                        ft.Icon(ft.Icons.LOCATION_ON, size=24, color=ft.Colors.WHITE), 
+                        self.location_text,
+                    ],
+                    alignment=ft.MainAxisAlignment.CENTER, spacing=8,
+                ),
+                self.weather_icon_image,
+                ft.Container(height=4),
+                self.desc_text,
+                ft.Container(height=8),
+                self.main_temp_text,
+                ft.Container(height=4),
+                self.feels_like_text,
+                ft.Container(height=8),
+                self.high_low_text
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER, 
+            spacing=0, 
+        )
+
         # Metric Texts
         self.humidity_value_text = self.create_themed_text("--%", size=16, weight=ft.FontWeight.W_800)
         self.wind_value_text = self.create_themed_text("-- m/s", size=16, weight=ft.FontWeight.W_800)
@@ -228,10 +322,12 @@ class WeatherApp:
 
     def _build_forecast_display(self):
         """Initialize forecast section."""
+        # Fixed pool of cards, refilled on every search instead of recreated
+        self.forecast_cards = [self.create_forecast_card() for _ in range(Config.FORECAST_DAYS)]
         self.forecast_row = ft.Row(
             spacing=6,
             alignment=ft.MainAxisAlignment.CENTER,
-            controls=[] 
+            controls=[card["container"] for card in self.forecast_cards]
         )
         
         self.forecast_container_wrapper = ft.Container(
@@ -330,21 +426,16 @@ class WeatherApp:
     def load_history(self):
         if self.history_file.exists():
             try:
-                with self.history_file.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list): 
-                        return data
-            except (json.JSONDecodeError, OSError) as e:
+                data = codec.loads(self.history_file.read_bytes())
+                if isinstance(data, list): 
+                    return data
+            except (ValueError, OSError) as e:
                 print(f"Error loading history: {e}")
                 return []
         return []
 
     def save_history(self):
-        try:
-            with self.history_file.open("w", encoding="utf-8") as f:
-                json.dump(self.search_history, f, ensure_ascii=False, indent=2)
-        except Exception as e: 
-            print(f"History Save Error: {e}")
+        self.history_writer.schedule(self.search_history)
 
     def add_to_history(self, city: str):
         city = city.strip()
@@ -385,21 +476,22 @@ class WeatherApp:
         if not hasattr(self, "city_input"):
             return
         
+        self.set_searchbar_controls(self.build_searchbar_controls())
+
+    def set_searchbar_controls(self, controls):
         # Update controls
-        self.city_input.controls = self.build_searchbar_controls()
+        self.city_input.controls = controls
         
         # Height calculation
         header_height = 70 
         item_height = 50
-        item_count = len(self.search_history) if self.search_history else 1
-        visible_items = min(item_count, 5)
+        visible_items = min(len(controls), 5)
         calculated_height = header_height + (visible_items * item_height) + 20
 
         # Apply height
         self.city_input.view_height = calculated_height
         
-        if self.city_input.page:
-            self.city_input.update()
+        self.ui_updates.mark(self.city_input)
 
     # Theme Logic
     def create_themed_text(self, value, size, weight=None, italic=False):
@@ -409,96 +501,46 @@ class WeatherApp:
             color=ft.Colors.BLACK if not self.is_dark_mode else ft.Colors.WHITE,
             animate_opacity=300,
         )
-        self.text_elements.append(t)
-        return t
+        return self.theme_registry.add_text(t)
 
     def get_weather_gradient(self, condition):
-        if self.is_dark_mode:
-            gradients = {
-                "Clear": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#1A237E", "#311B92"]),
-                "Clouds": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#455A64", "#263238"]),
-                "Rain": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#37474F", "#102027"]),
-                "Snow": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#78909C", "#455A64"]),
-                "Thunderstorm": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#212121", "#000000"]),
-                "Drizzle": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#37474F", "#263238"]),
-                "Mist": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#546E7A", "#37474F"]),
-                "Haze": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#546E7A", "#37474F"]),
-            }
-        else:
-             gradients = {
-                "Clear": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.LIGHT_BLUE_200, ft.Colors.BLUE_400]),
-                "Clouds": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.BLUE_GREY_100, ft.Colors.BLUE_GREY_400]),
-                "Rain": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.BLUE_GREY_400, ft.Colors.GREY_700]),
-                "Snow": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.WHITE, ft.Colors.LIGHT_BLUE_100]),
-                "Thunderstorm": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.DEEP_PURPLE_700, ft.Colors.GREY_900]),
-                "Drizzle": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.LIGHT_BLUE_200, ft.Colors.BLUE_GREY_200]),
-                "Mist": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.GREY_300, ft.Colors.GREY_500]),
-                "Haze": ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[ft.Colors.GREY_300, ft.Colors.GREY_500]),
-            }
-        return gradients.get(condition, gradients["Clear"])
+        return theme_palette.weather_gradient(condition, self.is_dark_mode)
 
     def toggle_theme(self, e):
+        action = self.ui_updates.begin_action("toggle_theme")
         self.is_dark_mode = not self.is_dark_mode
         
+        palette = theme_palette.tokens(self.is_dark_mode)
+        
         # Toggle Theme Mode
         if self.is_dark_mode:
             self.page.theme_mode = ft.ThemeMode.DARK
             self.theme_menu_item.icon = ft.Icons.LIGHT_MODE
             self.theme_menu_item.text = "Light Mode"
-            
-            self.page.bgcolor = "#121212" 
-            card_bg = "#212529"
-            text_color = ft.Colors.WHITE
-            current_shadow = None 
-            
-            # Update Buttons
-            self.search_button.bgcolor = "#212529" 
-            self.search_icon.color = ft.Colors.WHITE 
-            
-            self.gps_button.bgcolor = "#212529"
-            self.gps_icon.color = ft.Colors.WHITE
-            
-            self.city_input.view_bgcolor = "#212529"
-            
-            # Update Error Container for Dark Mode
-            self.error_container.bgcolor = "#3E1A1A" # Dark Red
-            self.error_container.border = ft.border.all(1, "#EF5350")
-            self.error_text.color = "#FFCDD2" # Light Red Text
-            self.error_icon.color = "#EF5350"
-            
         else:
             self.page.theme_mode = ft.ThemeMode.LIGHT
             self.theme_menu_item.icon = ft.Icons.DARK_MODE
             self.theme_menu_item.text = "Dark Mode"
 
-            self.page.bgcolor = ft.Colors.WHITE
-            card_bg = ft.Colors.WHITE
-            text_color = ft.Colors.BLUE_900
-            current_shadow = self.card_shadow 
+        self.page.bgcolor = palette.page_bg
+        
+        # Update Buttons
+        self.search_button.bgcolor = palette.button_bg
+        self.search_icon.color = palette.button_icon
+        
+        self.gps_button.bgcolor = palette.button_bg
+        self.gps_icon.color = palette.button_icon
+        
+        self.city_input.view_bgcolor = palette.search_view_bg
+
+        # Update Error Container
+        self.error_container.bgcolor = palette.error_bg
+        self.error_container.border = palette.error_border
+        self.error_text.color = palette.error_text
+        self.error_icon.color = palette.error_icon
 
-            # Update Buttons
-            self.search_button.bgcolor = ft.Colors.BLUE_50 
-            self.search_icon.color = ft.Colors.BLUE_700 
-            
-            self.gps_button.bgcolor = ft.Colors.BLUE_50
-            self.gps_icon.color = ft.Colors.BLUE_700
-            
-            self.city_input.view_bgcolor = ft.Colors.WHITE
-
-            # Update Error Container for Light Mode
-            self.error_container.bgcolor = ft.Colors.RED_50
-            self.error_container.border = ft.border.all(1, ft.Colors.RED_200)
-            self.error_text.color = ft.Colors.RED_900
-            self.error_icon.color = ft.Colors.RED_700
-
-        # Update Cards
-        for card in self.card_containers:
-            card.bgcolor = card_bg
-            card.shadow = current_shadow
-            
-        # Update Text
-        for text in self.text_elements:
-            text.color = text_color
+        # Update Cards and Text
+        self.theme_registry.apply(palette.text, palette.card_bg, palette.card_shadow)
 
         # Update Container Gradient
         if self.current_weather_data:
@@ -506,9 +548,11 @@ class WeatherApp:
             self.weather_container.bgcolor = None
         else:
             self.weather_container.gradient = None
-            self.weather_container.bgcolor = ft.Colors.BLUE_50 if not self.is_dark_mode else "#212529"
+            self.weather_container.bgcolor = palette.empty_card_bg
 
-        self.page.update()
+        self.ui_updates.mark()
+        self.ui_updates.flush()
+        self.ui_updates.end_action(action)
 
     # Geolocation Logic
     async def on_gps_click(self, e):
@@ -520,7 +564,7 @@ class WeatherApp:
         for control in [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]:
             control.visible = False
             control.opacity = 0
-        self.page.update()
+        self.ui_updates.mark()
 
         try:
             # Request Permission
@@ -577,54 +621,170 @@ class WeatherApp:
 
     async def fetch_weather_by_coords(self, lat, lon):
         """Orchestrator to fetch weather and forecast using coordinates."""
+        generation = self.searches.claim()
         try:
             # Fetch Data
             weather_task = self.weather_service.get_weather_by_coordinates(lat, lon)
             forecast_task = self.weather_service.get_forecast_by_coordinates(lat, lon)
             
             weather_data, forecast_data = await asyncio.gather(weather_task, forecast_task)
+            if not self.searches.is_current(generation):
+                self.searches.discard(2, late=True)
+                return
             
             self.current_weather_data = weather_data
+            self.current_forecast_data = forecast_data
             
             # Update UI
             await self.display_weather(weather_data, animate=False)
             await self.process_and_display_forecast(forecast_data, animate=False)
 
             # Update Search Bar
-            detected_city = weather_data.get("name", "")
+            detected_city = weather_data.name
             if detected_city:
                 self.city_input.value = detected_city
                 self.add_to_history(detected_city)
+            self.current_city = detected_city or None
+            self.current_place = None
 
             self.loading.visible = False
-            self.page.update()
+            self.ui_updates.mark()
+            self.start_auto_refresh()
             
             # Trigger Animations
-            await self.animate_show_control(self.weather_container)
-            await asyncio.sleep(0.2)
-            await self.animate_show_control(self.humidity_wind_container)
-            await asyncio.sleep(0.2)
-            await self.animate_show_control(self.forecast_container_wrapper)
+            await self.animations.reveal(
+                [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]
+            )
 
         except Exception as e:
             self.loading.visible = False
             self.show_error(str(e))
 
+    async def restore_last_weather(self):
+        """Paint cached weather for the top history city, then refresh it."""
+        city = self.search_history[0]
+        if not await self.paint_cached_city(city, self.gazetteer.resolve(city)):
+            return
+
+        # Fetch fresh data in the background and patch what changed
+        try:
+            await self.refresh_current_city()
+        except Exception as e:
+            print(f"Startup refresh failed: {e}")
+        self.start_auto_refresh()
+
+    async def paint_cached_city(self, city: str, place: Optional[Place] = None) -> bool:
+        """Show a city's last-known weather at once, without the network or animations."""
+        if place is not None:
+            weather_data = self.weather_service.peek_weather_by_coordinates(place.lat, place.lon)
+            forecast_data = self.weather_service.peek_forecast_by_coordinates(place.lat, place.lon)
+        else:
+            weather_data = self.weather_service.peek_weather(city)
+            forecast_data = self.weather_service.peek_forecast(city)
+        if not weather_data or not forecast_data:
+            return False
+
+        self.city_input.value = city
+        self.current_city = city
+        self.current_place = place
+        self.current_weather_data = weather_data
+        self.current_forecast_data = forecast_data
+        await self.display_weather(weather_data, animate=False)
+        await self.process_and_display_forecast(forecast_data, animate=False)
+        for control in [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]:
+            control.visible = True
+            control.scale = 1.0
+            control.opacity = 1.0
+        self.loading.visible = False
+        self.hide_error()
+        return True
+
+    async def open_history_city(self, generation: int, city: str, place: Optional[Place] = None):
+        """History tap: paint from cache first, then revalidate in the background."""
+        action = self.ui_updates.begin_action("history")
+        if not await self.paint_cached_city(city, place):
+            await self.get_weather(generation, city, place)
+            return
+        self.add_to_history(city)
+        self.ui_updates.flush()
+        self.ui_updates.end_action(action)
+
+        try:
+            await self.refresh_current_city()
+        except Exception as e:
+            print(f"History refresh failed: {e}")
+        self.start_auto_refresh()
+
+    def start_auto_refresh(self):
+        """(Re)start periodic refreshes for the city on screen."""
+        if Config.AUTO_REFRESH_ENABLED:
+            self.page.run_task(self.refresher.run)
+
+    async def refresh_current_city(self):
+        """Revalidate the displayed city and push only the controls that changed."""
+        city = self.current_city
+        if not city:
+            return
+        place = self.current_place
+        generation = self.searches.generation
+
+        if place is not None:
+            weather_data, forecast_data = await asyncio.gather(
+                self.weather_service.get_weather_by_coordinates(
+                    place.lat, place.lon, priority=PRIORITY_BACKGROUND, revalidate=True
+                ),
+                self.weather_service.get_forecast_by_coordinates(
+                    place.lat, place.lon, priority=PRIORITY_BACKGROUND, revalidate=True
+                ),
+            )
+        else:
+            weather_data, forecast_data = await asyncio.gather(
+                self.weather_service.get_weather(city, priority=PRIORITY_BACKGROUND, revalidate=True),
+                self.weather_service.get_forecast(city, priority=PRIORITY_BACKGROUND, revalidate=True),
+            )
+        if not self.searches.is_current(generation) or city != self.current_city:
+            return
+
+        changed = []
+        if weather_data is not self.current_weather_data:
+            self.current_weather_data = weather_data
+            changed += self.patch_weather_values(weather_data)
+            if weather_data.condition != self.current_condition_main:
+                self.current_condition_main = weather_data.condition
+                self.weather_container.gradient = self.get_weather_gradient(weather_data.condition)
+                changed.append(self.weather_container)
+
+        if forecast_data is not self.current_forecast_data:
+            self.current_forecast_data = forecast_data
+            await self.process_and_display_forecast(forecast_data, animate=False)
+            changed += [self.forecast_row, self.high_low_text]
+        elif changed:
+            # Current temperature may have moved today's high/low, on its card too
+            self.update_daily_range()
+            changed += self.patch_temperature_values()
+            for item in self.forecast_text_controls:
+                if item['today']:
+                    item['high'] = self.daily_high_c
+                    item['low'] = self.daily_low_c
+                    previous = item['control'].value
+                    self.update_forecast_values()
+                    if item['control'].value != previous:
+                        changed.append(item['control'])
+
+        if changed:
+            self.ui_updates.mark(*changed)
+
     # Unit Conversion
     async def toggle_unit(self, e):
-        # Fade Out
-        self.main_temp_text.opacity = 0
-        self.feels_like_text.opacity = 0
-        self.high_low_text.opacity = 0
-        
-        for item in self.forecast_text_controls:
-            item['control'].opacity = 0
-            
-        self.page.update()
-        
-        await asyncio.sleep(0.3)
-
-        # Update Data
+        action = self.ui_updates.begin_action("toggle_unit")
+        texts = [self.main_temp_text, self.feels_like_text, self.high_low_text]
+        texts += [item['control'] for item in self.forecast_text_controls]
+        await self.animations.swap(texts, self.apply_unit_toggle)
+        self.ui_updates.mark()
+        self.ui_updates.flush()
+        self.ui_updates.end_action(action)
+
+    def apply_unit_toggle(self):
         self.is_celsius = not self.is_celsius
         
         if self.is_celsius:
@@ -636,16 +796,6 @@ class WeatherApp:
             self.update_weather_values()
         if self.forecast_text_controls:
             self.update_forecast_values()
-            
-        # Fade In
-        self.main_temp_text.opacity = 1
-        self.feels_like_text.opacity = 1
-        self.high_low_text.opacity = 1
-        
-        for item in self.forecast_text_controls:
-            item['control'].opacity = 1
-            
-        self.page.update()
 
     def convert_temp_val(self, temp_c):
         if self.is_celsius:
@@ -658,23 +808,60 @@ class WeatherApp:
         return f"{val:.1f}{unit}"
 
     def update_weather_values(self):
+        self.patch_temperature_values()
+
+    def patch_temperature_values(self):
+        """Write temperature texts, returning the controls whose value changed."""
         if not self.current_weather_data:
-            return
+            return []
         data = self.current_weather_data
-        main_data = data.get("main", {})
         
-        temp_c = main_data.get("temp", 0)
-        feels_like_c = main_data.get("feels_like", 0)
+        temp_c = data.temp
+        feels_like_c = data.feels_like
 
-        self.main_temp_text.value = self.calculate_temp(temp_c)
-        self.feels_like_text.value = f"Feels like {self.calculate_temp(feels_like_c)}"
-        
         if self.daily_high_c is not None and self.daily_low_c is not None:
             val_high = self.calculate_temp(self.daily_high_c)
             val_low = self.calculate_temp(self.daily_low_c)
-            self.high_low_text.value = f"↑ {val_high}   ↓ {val_low}"
+            high_low = f"↑ {val_high}   ↓ {val_low}"
         else:
-            self.high_low_text.value = ""
+            high_low = ""
+
+        return self.set_text_values([
+            (self.main_temp_text, self.calculate_temp(temp_c)),
+            (self.feels_like_text, f"Feels like {self.calculate_temp(feels_like_c)}"),
+            (self.high_low_text, high_low),
+        ])
+
+    def patch_weather_values(self, data: CurrentConditions):
+        """Write current-condition texts, returning the controls whose value changed."""
+        changed = self.set_text_values([
+            (self.location_text, f"{data.name}, {data.country}"),
+            (self.desc_text, data.description.title()),
+            (self.humidity_value_text, f"{data.humidity}%"),
+            (self.wind_value_text, f"{data.wind_speed} m/s"),
+            (self.pressure_value_text, f"{data.pressure} hPa"),
+            (self.cloud_value_text, f"{data.clouds}%"),
+        ])
+        
+        icon_src = self.weather_icon_url(data.icon)
+        if self.weather_icon_image.src != icon_src:
+            self.weather_icon_image.src = icon_src
+            changed.append(self.weather_icon_image)
+        
+        return changed + self.patch_temperature_values()
+
+    @staticmethod
+    def weather_icon_url(icon_code):
+        return f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
+
+    @staticmethod
+    def set_text_values(pairs):
+        changed = []
+        for control, value in pairs:
+            if control.value != value:
+                control.value = value
+                changed.append(control)
+        return changed
 
     def update_forecast_values(self):
         for item in self.forecast_text_controls:
@@ -689,15 +876,28 @@ class WeatherApp:
     def on_search(self, e):
         self.perform_search(self.city_input.value or "")
 
-    def perform_search(self, city: str):
+    def perform_search(self, city: str, place: Optional[Place] = None, instant=False):
         city = city.strip()
         if not city:
             self.show_error("Please enter a city name")
             return
+        self.prefetcher.cancel()
         self.city_input.value = city
         self.hide_error()
-        self.page.update()
-        self.page.run_task(self.get_weather)
+        self.ui_updates.mark()
+        self.live_search.cancel()
+        # Known cities go by coordinates, skipping the server-side name lookup
+        if place is None:
+            place = self.gazetteer.resolve(city)
+        handler = self.open_history_city if instant else self.get_weather
+        self.searches.start(handler, city, place)
+
+    def run_live_search(self, query: str):
+        """Debounced search-as-you-type; quietly keeps the last result on errors."""
+        if len(query) < Config.LIVE_SEARCH_MIN_CHARS or query == self.current_city:
+            return
+        self.prefetcher.cancel()
+        self.searches.start(self.get_weather, query, self.gazetteer.resolve(query), True, live=True)
 
     def on_city_tap(self, e):
         self.city_input.open_view()
@@ -709,211 +909,205 @@ class WeatherApp:
         self.city_input.close_view(city)
         self.perform_search(city)
 
+    def on_city_change(self, e):
+        """Type-ahead suggestions, plus a debounced live search when enabled."""
+        query = (e.data or "").strip()
+        if Config.LIVE_SEARCH_ENABLED:
+            # A live lookup in flight answers an outdated query now; submitted
+            # searches and history taps stay put until a new lookup starts
+            self.searches.cancel_live()
+            self.live_search.trigger(query)
+
+        if not self.gazetteer.available:
+            return
+        places = self.gazetteer.complete(query, limit=Config.AUTOCOMPLETE_LIMIT) if query else []
+        if not places:
+            self.refresh_searchbar_controls()
+            return
+        self.set_searchbar_controls([
+            ft.ListTile(
+                title=ft.Text(place.label),
+                leading=ft.Icon(ft.Icons.PLACE),
+                data=place,
+                on_click=self.on_suggestion_click,
+                height=50
+            )
+            for place in places
+        ])
+
+    def on_suggestion_click(self, e):
+        place = e.control.data
+        self.city_input.close_view(place.label)
+        self.perform_search(place.label, place)
+
     def on_history_click(self, e):
         city = e.control.data
         self.city_input.close_view(city)
-        self.perform_search(city)
+        self.perform_search(city, instant=True)
 
     # Data Fetching
-    async def get_weather(self):
-        city = self.city_input.value.strip()
-        if not city:
-            self.show_error("Please enter a city name")
-            return
-
-        self.add_to_history(city)
+    async def get_weather(self, generation: int, city: str, place: Optional[Place] = None, live=False):
+        started = time.perf_counter()
+        self.ui_metrics.reset()
+        action = self.ui_updates.begin_action("live_search" if live else "search")
+        if not live:
+            self.add_to_history(city)
         self.loading.visible = True
         self.hide_error()
         
-        # Reset UI
-        for control in [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]:
-            control.visible = False
-            control.scale = 0.9
-            control.opacity = 0
+        # Reset UI (live results replace the current ones without hiding them)
+        if not live:
+            for control in [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]:
+                control.visible = False
+                control.scale = 0.9
+                control.opacity = 0
             
-        self.page.update()
+        self.ui_updates.mark()
 
         try:
             # Fetch Data
-            weather_task = self.weather_service.get_weather(city)
-            forecast_task = self.weather_service.get_forecast(city)
-            weather_data, forecast_data = await asyncio.gather(weather_task, forecast_task)
+            if place is not None:
+                weather_task = self.weather_service.get_weather_by_coordinates(place.lat, place.lon)
+                forecast_task = self.weather_service.get_forecast_by_coordinates(place.lat, place.lon)
+            else:
+                weather_task = self.weather_service.get_weather(city)
+                forecast_task = self.weather_service.get_forecast(city)
+            try:
+                weather_data, forecast_data = await asyncio.gather(weather_task, forecast_task)
+            except asyncio.CancelledError:
+                self.searches.discard(2)
+                raise
+            if not self.searches.is_current(generation):
+                self.searches.discard(2, late=True)
+                self.ui_updates.end_action(action)
+                return
             
+            self.current_city = city
+            self.current_place = place
             self.current_weather_data = weather_data
+            self.current_forecast_data = forecast_data
             
             # Update UI
             await self.display_weather(weather_data, animate=False)
             await self.process_and_display_forecast(forecast_data, animate=False)
 
             self.loading.visible = False
-            self.page.update()
+            self.ui_updates.mark()
+            self.start_auto_refresh()
             
             # Animate Elements
-            await self.animate_show_control(self.weather_container)
-            await asyncio.sleep(0.2) 
-            await self.animate_show_control(self.humidity_wind_container)
-            await asyncio.sleep(0.2) 
-            await self.animate_show_control(self.forecast_container_wrapper)
+            await self.animations.reveal(
+                [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]
+            )
 
+        except asyncio.CancelledError:
+            # A newer search superseded this one; leave the last result on screen
+            self.loading.visible = False
+            if self.current_weather_data is not None:
+                for control in [self.weather_container, self.humidity_wind_container, self.forecast_container_wrapper]:
+                    control.visible = True
+                    control.scale = 1.0
+                    control.opacity = 1.0
+            self.ui_updates.mark()
+            self.ui_updates.end_action(action)
+            raise
         except Exception as e:
             self.loading.visible = False
-            self.show_error(str(e))
+            if live:
+                print(f"Live search failed for {city}: {e}")
+                self.ui_updates.mark(self.loading)
+            else:
+                self.show_error(str(e))
+        
+        self.ui_updates.flush()
+        self.ui_updates.end_action(action)
+        if Config.UI_METRICS_ENABLED:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"Search '{city}' UI cost: {self.ui_metrics.snapshot()}, {elapsed_ms:.0f} ms end to end")
+            print(f"Search tasks: {self.searches.stats}")
     
     # Display Logic
-    async def display_weather(self, data: dict, animate=True):
-        city_name = data.get("name", "Unknown")
-        country = data.get("sys", {}).get("country", "")
-        description = data.get("weather", [{}])[0].get("description", "").title()
-        icon_code = data.get("weather", [{}])[0].get("icon", "01d")
-        self.current_condition_main = data.get("weather", [{}])[0].get("main", "Clear")
-        
-        humidity = data.get("main", {}).get("humidity", 0)
-        pressure = data.get("main", {}).get("pressure", 0)
-        cloudiness = data.get("clouds", {}).get("all", 0)
-        wind_speed = data.get("wind", {}).get("speed", 0)
-
-        self.location_text.value = f"{city_name}, {country}"
-        self.desc_text.value = description
-        self.humidity_value_text.value = f"{humidity}%"
-        self.wind_value_text.value = f"{wind_speed} m/s"
-        self.pressure_value_text.value = f"{pressure} hPa"
-        self.cloud_value_text.value = f"{cloudiness}%"
+    async def display_weather(self, data: CurrentConditions, animate=True):
+        self.current_condition_main = data.condition
         
         self.daily_high_c = None
         self.daily_low_c = None
         
-        self.update_weather_values()
+        self.patch_weather_values(data)
 
         self.weather_container.gradient = self.get_weather_gradient(self.current_condition_main)
         self.weather_container.bgcolor = None 
-
-        self.weather_container.content = ft.Column(
-            [
-                ft.Row(
-                    [
-                        ft.Icon(ft.Icons.LOCATION_ON, size=24, color=ft.Colors.WHITE), 
-                        self.location_text,
-                    ],
-                    alignment=ft.MainAxisAlignment.CENTER, spacing=8,
-                ),
-                ft.Image(src=f"https://openweathermap.org/img/wn/{icon_code}@2x.png", width=90, height=90),
-                ft.Container(height=4),
-                self.desc_text,
-                ft.Container(height=8),
-                self.main_temp_text,
-                ft.Container(height=4),
-                self.feels_like_text,
-                ft.Container(height=8),
-                self.high_low_text
-            ],
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER, 
-            spacing=0, 
-        )
         
         if animate:
             self.weather_container.visible = True
             self.humidity_wind_container.visible = True
 
-    async def process_and_display_forecast(self, data: dict, animate=True):
-        raw_list = data.get("list", [])
-        daily_groups = defaultdict(lambda: {"temps": [], "icons": [], "dt": 0})
-        
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        
-        # Group by Date
-        for item in raw_list:
-            ts = item.get("dt")
-            date_str = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
-            
-            temp = item.get("main", {}).get("temp")
-            icon = item.get("weather", [{}])[0].get("icon")
-            
-            daily_groups[date_str]["temps"].append(temp)
-            daily_groups[date_str]["icons"].append(icon)
-            daily_groups[date_str]["dt"] = ts
-
-        current_temp = self.current_weather_data.get("main", {}).get("temp", 0)
+    async def process_and_display_forecast(self, data: Forecast, animate=True):
+        # Bucket by day in the queried city's timezone, not the host's
+        aggregator = ForecastAggregator.for_forecast(
+            data, fallback_offset=self.current_weather_data.timezone
+        )
 
         # Calculate Daily High/Low
-        if today_str in daily_groups:
-            today_temps = daily_groups[today_str]["temps"]
-            self.daily_high_c = max(today_temps + [current_temp])
-            self.daily_low_c = min(today_temps + [current_temp])
-        else:
-            self.daily_high_c = current_temp
-            self.daily_low_c = current_temp
+        today_index = aggregator.today_index()
+        self.today_summary = aggregator.get(today_index)
+        self.update_daily_range()
 
         self.update_weather_values()
 
-        # Build Cards
-        sorted_dates = sorted(daily_groups.keys())
-        forecast_days = sorted_dates[:5]
-        
-        self.forecast_row.controls.clear()
+        # Fill Cards
         self.forecast_text_controls.clear() 
+        days = aggregator.days(len(self.forecast_cards))
 
-        for date_str in forecast_days:
-            day_data = daily_groups[date_str]
-            
-            if date_str == today_str and self.daily_high_c is not None:
+        for card, day in zip(self.forecast_cards, days):
+            if day.day == today_index and self.daily_high_c is not None:
                 high_temp = self.daily_high_c
                 low_temp = self.daily_low_c
             else:
-                high_temp = max(day_data["temps"])
-                low_temp = min(day_data["temps"])
+                high_temp = day.high
+                low_temp = day.low
 
-            mid_index = len(day_data["icons"]) // 2
-            icon_code = day_data["icons"][mid_index]
-            
-            ts = day_data["dt"]
-            dt_obj = datetime.fromtimestamp(ts)
-            day_name = dt_obj.strftime("%a")
-            
-            self.create_forecast_card(day_name, icon_code, high_temp, low_temp)
+            self.fill_forecast_card(card, day.weekday, day.icon, high_temp, low_temp, day.day == today_index)
+
+        for card in self.forecast_cards[len(days):]:
+            card["container"].visible = False
     
         self.update_forecast_values()
         
         if animate:
             self.forecast_container_wrapper.visible = True
-            self.page.update()
-
-    async def animate_show_control(self, control):
-        """Resets and then animates a control into view."""
-        # Set initial state
-        control.visible = True
-        control.scale = 0.9
-        control.opacity = 0
-        control.update()
-        
-        await asyncio.sleep(0.05)
-        
-        # Trigger animation
-        control.scale = 1.0
-        control.opacity = 1.0
-        control.update()
+            self.ui_updates.mark()
+
+    def update_daily_range(self):
+        """Fold the current temperature into today's forecast high/low."""
+        current_temp = self.current_weather_data.temp
+        today = self.today_summary
+        if today is not None:
+            self.daily_high_c = max(today.high, current_temp)
+            self.daily_low_c = min(today.low, current_temp)
+        else:
+            self.daily_high_c = current_temp
+            self.daily_low_c = current_temp
 
-    def create_forecast_card(self, day_name, icon_code, high_c, low_c):
-        day_text = self.create_themed_text(day_name, size=14, weight=ft.FontWeight.W_600)
+    def create_forecast_card(self):
+        """Build one empty forecast card; fill_forecast_card() sets its values."""
+        day_text = self.create_themed_text("", size=14, weight=ft.FontWeight.W_600)
         temp_text = self.create_themed_text("", size=14, weight=ft.FontWeight.BOLD) 
-        
-        self.forecast_text_controls.append({
-            "high": high_c,
-            "low": low_c,
-            "control": temp_text
-        })
+        icon_image = ft.Image(src=self.weather_icon_url("01d"), width=48, height=48)
 
         card = ft.Container(
+            visible=False,
             width=64.14,
             height=154,
-            bgcolor=ft.Colors.WHITE if not self.is_dark_mode else "#212529",
+            bgcolor=theme_palette.tokens(self.is_dark_mode).card_bg,
             border_radius=10, 
-            shadow=self.card_shadow if not self.is_dark_mode else None,
+            shadow=theme_palette.tokens(self.is_dark_mode).card_shadow,
             padding=ft.padding.symmetric(vertical=10),
             animate=self.theme_animation,
             content=ft.Column(
                 [
                     day_text,
-                    ft.Image(src=f"https://openweathermap.org/img/wn/{icon_code}@2x.png", width=48, height=48),
+                    icon_image,
                     temp_text
                 ],
                 spacing=19,
@@ -922,8 +1116,20 @@ class WeatherApp:
             )
         )
         
-        self.card_containers.append(card)
-        self.forecast_row.controls.append(card)
+        self.theme_registry.add_card(card)
+        return {"container": card, "day": day_text, "icon": icon_image, "temp": temp_text}
+
+    def fill_forecast_card(self, card, day_name, icon_code, high_c, low_c, today=False):
+        card["day"].value = day_name
+        card["icon"].src = self.weather_icon_url(icon_code)
+        card["container"].visible = True
+        
+        self.forecast_text_controls.append({
+            "high": high_c,
+            "low": low_c,
+            "control": card["temp"],
+            "today": today
+        })
 
     def show_error(self, message: str):
         # Update text
@@ -939,7 +1145,7 @@ class WeatherApp:
         self.error_container.opacity = 1
         self.error_container.offset = ft.Offset(0, 0)
         self.error_container.scale = 1.0
-        self.page.update()
+        self.ui_updates.mark()
 
     def hide_error(self):
         """Hide the error container smoothly."""
@@ -947,7 +1153,7 @@ class WeatherApp:
         self.error_container.offset = ft.Offset(0, -0.5)
         self.error_container.scale = 0.95
         self.error_container.visible = False
-        self.page.update()
+        self.ui_updates.mark()
         
     def create_metric_card(self, icon, label, value_text: ft.Text, icon_color):
         label_text = self.create_themed_text(label, size=12, weight=ft.FontWeight.W_500, italic=True)
@@ -955,9 +1161,9 @@ class WeatherApp:
 
         container = ft.Container(
             width=169, height=115, padding=8, 
-            bgcolor=ft.Colors.WHITE if not self.is_dark_mode else "#212529", 
+            bgcolor=theme_palette.tokens(self.is_dark_mode).card_bg, 
             border_radius=10,
-            shadow=self.card_shadow if not self.is_dark_mode else None,
+            shadow=theme_palette.tokens(self.is_dark_mode).card_shadow,
             animate=self.theme_animation,
             content=ft.Column(
                 [
@@ -968,8 +1174,7 @@ class WeatherApp:
                 alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=8,
             ),
         )
-        self.card_containers.append(container)
-        return container
+        return self.theme_registry.add_card(container)
 
 def main(page: ft.Page):
     WeatherApp(page)
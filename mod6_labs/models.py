@@ -0,0 +1,126 @@
+"""Typed weather domain model built once from API payloads."""
+
+from typing import Dict, Tuple
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+class CurrentConditions:
+    """Current weather for one location, holding only the fields the UI shows."""
+
+    __slots__ = (
+        "name", "country", "condition", "description", "icon",
+        "temp", "feels_like", "humidity", "pressure", "clouds",
+        "wind_speed", "timezone",
+    )
+
+    def __init__(self, name, country, condition, description, icon,
+                 temp, feels_like, humidity, pressure, clouds,
+                 wind_speed, timezone):
+        self.name = name
+        self.country = country
+        self.condition = condition
+        self.description = description
+        self.icon = icon
+        self.temp = temp
+        self.feels_like = feels_like
+        self.humidity = humidity
+        self.pressure = pressure
+        self.clouds = clouds
+        self.wind_speed = wind_speed
+        self.timezone = timezone
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "CurrentConditions":
+        weather = (payload.get("weather") or [{}])[0]
+        main = payload.get("main", {})
+        return cls(
+            name=payload.get("name", "Unknown"),
+            country=payload.get("sys", {}).get("country", ""),
+            condition=weather.get("main", "Clear"),
+            description=weather.get("description", ""),
+            icon=weather.get("icon", "01d"),
+            temp=main.get("temp", 0),
+            feels_like=main.get("feels_like", 0),
+            humidity=main.get("humidity", 0),
+            pressure=main.get("pressure", 0),
+            clouds=payload.get("clouds", {}).get("all", 0),
+            wind_speed=payload.get("wind", {}).get("speed", 0),
+            timezone=payload.get("timezone", 0),
+        )
+
+
+class ForecastPoint:
+    """A single forecast reading."""
+
+    __slots__ = ("dt", "temp", "icon")
+
+    def __init__(self, dt: int, temp: float, icon: str):
+        self.dt = dt
+        self.temp = temp
+        self.icon = icon
+
+    @classmethod
+    def from_entry(cls, entry: Dict) -> "ForecastPoint":
+        """Build from one item of the API's forecast "list"."""
+        weather = entry.get("weather")
+        return cls(
+            dt=entry.get("dt"),
+            temp=entry.get("main", {}).get("temp"),
+            icon=weather[0].get("icon") if weather else None,
+        )
+
+
+class Forecast:
+    """Forecast readings for a city plus its UTC offset in seconds."""
+
+    __slots__ = ("city", "timezone", "points")
+
+    def __init__(self, city: str, timezone, points: Tuple[ForecastPoint, ...]):
+        self.city = city
+        self.timezone = timezone
+        self.points = points
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "Forecast":
+        city = payload.get("city", {})
+        return cls(
+            city=city.get("name", ""),
+            timezone=city.get("timezone"),
+            points=tuple(ForecastPoint.from_entry(e) for e in payload.get("list", [])),
+        )
+
+
+class DailySummary:
+    """Running high/low and icon counts for one calendar day."""
+
+    __slots__ = ("day", "dt", "high", "low", "count", "icon_counts")
+
+    def __init__(self, day: int, dt: int, temp: float):
+        self.day = day  # days since the epoch in the aggregator's timezone
+        self.dt = dt  # first timestamp seen for the day
+        self.high = temp
+        self.low = temp
+        self.count = 0
+        self.icon_counts: Dict[str, int] = {}
+
+    def add(self, temp: float, icon):
+        if temp > self.high:
+            self.high = temp
+        elif temp < self.low:
+            self.low = temp
+        self.count += 1
+        if icon:
+            self.icon_counts[icon] = self.icon_counts.get(icon, 0) + 1
+
+    @property
+    def icon(self) -> str:
+        """Most frequent icon of the day (earliest seen wins ties)."""
+        if not self.icon_counts:
+            return "01d"
+        return max(self.icon_counts, key=self.icon_counts.__getitem__)
+
+    @property
+    def weekday(self) -> str:
+        # 1970-01-01 (day 0) was a Thursday
+        return WEEKDAYS[(self.day + 3) % 7]
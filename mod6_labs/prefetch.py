@@ -0,0 +1,80 @@
+"""Background cache warming for recently searched cities."""
+
+import asyncio
+from typing import Iterable, Optional
+
+from gazetteer import Gazetteer
+from rate_limiter import PRIORITY_BACKGROUND
+from weather_service import WeatherService, WeatherServiceError
+
+
+class PrefetchScheduler:
+    """
+    Warms weather and forecast caches for history cities at low priority.
+
+    Cities the gazetteer knows are warmed by coordinates, the same cache
+    keys a search for them uses.
+    """
+
+    def __init__(
+        self,
+        service: WeatherService,
+        limit: int,
+        concurrency: int,
+        gazetteer: Optional[Gazetteer] = None
+    ):
+        self.service = service
+        self.limit = limit
+        self.concurrency = concurrency
+        self.gazetteer = gazetteer
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.warmed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    async def run(self, cities: Iterable[str]):
+        """Prefetch the first `limit` cities; cancel() stops it at any point."""
+        self.cancel()
+        self._task = asyncio.current_task()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def warm(city: str):
+            async with semaphore:
+                try:
+                    await asyncio.gather(*self._lookups(city))
+                    self.warmed += 1
+                except WeatherServiceError as e:
+                    self.failed += 1
+                    print(f"Prefetch failed for {city}: {e}")
+
+        try:
+            await asyncio.gather(*(warm(city) for city in list(cities)[:self.limit]))
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _lookups(self, city: str):
+        place = self.gazetteer.resolve(city) if self.gazetteer is not None else None
+        if place is not None:
+            return (
+                self.service.get_weather_by_coordinates(place.lat, place.lon, priority=PRIORITY_BACKGROUND),
+                self.service.get_forecast_by_coordinates(place.lat, place.lon, priority=PRIORITY_BACKGROUND),
+            )
+        return (
+            self.service.get_weather(city, priority=PRIORITY_BACKGROUND),
+            self.service.get_forecast(city, priority=PRIORITY_BACKGROUND),
+        )
+
+    def cancel(self):
+        """
+        Stop a running prefetch, e.g. because the user started a search.
+
+        Safe to call from Flet's handler threads: the task is cancelled on
+        its own loop.
+        """
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.get_loop().call_soon_threadsafe(task.cancel)
+            self.cancelled += 1
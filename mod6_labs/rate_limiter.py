@@ -0,0 +1,99 @@
+"""Client-side rate limiting for the shared OpenWeatherMap API key."""
+
+import asyncio
+import bisect
+import time
+from collections import deque
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Upper bounds (ms) of the wait-time histogram buckets; the last bucket is open-ended
+WAIT_BUCKETS_MS = (0, 10, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class TokenBucket:
+    """
+    Async token bucket with a FIFO queue per priority lane.
+
+    Waiting interactive callers are always served before background ones;
+    within a lane callers are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate  # tokens per second
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lanes = {
+            PRIORITY_INTERACTIVE: deque(),
+            PRIORITY_BACKGROUND: deque(),
+        }
+        self._dispatcher = None
+
+        # Wait-time histogram per lane
+        self.histograms = {
+            lane: [0] * (len(WAIT_BUCKETS_MS) + 1) for lane in self._lanes
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _has_waiters(self) -> bool:
+        return any(self._lanes.values())
+
+    def _record_wait(self, priority: int, seconds: float):
+        index = bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)
+        self.histograms[priority][index] += 1
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE):
+        """Wait until a token is available for the given priority lane."""
+        self._refill()
+        if self.tokens >= 1 and not self._has_waiters():
+            self.tokens -= 1
+            self._record_wait(priority, 0)
+            return
+
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A token was granted but the caller went away; give it back
+                self.tokens = min(self.burst, self.tokens + 1)
+            raise
+        self._record_wait(priority, time.monotonic() - started)
+
+    async def _dispatch(self):
+        """Hand out tokens to queued callers as they become available."""
+        while self._has_waiters():
+            self._refill()
+            while self.tokens >= 1 and self._has_waiters():
+                lane = self._lanes[PRIORITY_INTERACTIVE] or self._lanes[PRIORITY_BACKGROUND]
+                waiter = lane.popleft()
+                if waiter.done():
+                    continue
+                waiter.set_result(None)
+                self.tokens -= 1
+
+            if self._has_waiters():
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    @property
+    def stats(self) -> dict:
+        labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        return {
+            "tokens": round(self.tokens, 2),
+            "waiting": {lane: len(queue) for lane, queue in self._lanes.items()},
+            "wait_histograms": {
+                lane: dict(zip(labels, counts))
+                for lane, counts in self.histograms.items()
+            },
+        }
@@ -0,0 +1,46 @@
+"""Periodic auto-refresh of the displayed city."""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional
+
+
+class RefreshScheduler:
+    """Calls a refresh coroutine on a jittered interval, skipping while paused."""
+
+    def __init__(self, interval: float, jitter: float, callback: Callable[[], Awaitable]):
+        self.interval = interval
+        self.jitter = jitter
+        self.callback = callback
+        self.paused = False
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.runs = 0
+        self.skipped = 0
+
+    async def run(self):
+        """Refresh until cancel(); starting a new run replaces the previous one."""
+        self.cancel()
+        self._task = asyncio.current_task()
+        try:
+            while True:
+                await asyncio.sleep(
+                    max(1.0, self.interval + random.uniform(-self.jitter, self.jitter))
+                )
+                if self.paused:
+                    self.skipped += 1
+                    continue
+                try:
+                    await self.callback()
+                    self.runs += 1
+                except Exception as e:
+                    print(f"Auto-refresh failed: {e}")
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def cancel(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
@@ -0,0 +1,109 @@
+"""Retry and circuit breaker helpers for the weather service."""
+
+import random
+import time
+from collections import deque
+from typing import Optional
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent requests."""
+
+    def __init__(self, attempts: int, base_delay: float, max_delay: float):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+
+        Returns None when no retry should happen, either because the attempts
+        are used up or because the server asked us to wait longer than max_delay.
+        """
+        if attempt >= self.attempts:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+
+class CircuitBreaker:
+    """Per-host breaker that fails fast after repeated upstream failures."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+        # Metrics
+        self.transitions = {}
+        self.history = deque(maxlen=50)
+        self.rejected = 0
+
+    def _transition(self, new_state: str):
+        if new_state == self.state:
+            return
+        edge = f"{self.state}->{new_state}"
+        self.transitions[edge] = self.transitions.get(edge, 0) + 1
+        self.history.append((time.time(), self.state, new_state))
+        self.state = new_state
+
+    def allow_request(self) -> bool:
+        """Return True if a request may go out now."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self._transition(self.HALF_OPEN)
+
+        if self.state == self.HALF_OPEN:
+            # Let a single trial request probe the upstream
+            if self._trial_in_flight:
+                self.rejected += 1
+                return False
+            self._trial_in_flight = True
+
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self._trial_in_flight = False
+        self._transition(self.CLOSED)
+
+    def release(self):
+        """Forget an in-flight trial that ended without an outcome (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(self.OPEN)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "transitions": dict(self.transitions),
+        }
@@ -0,0 +1,72 @@
+"""Keeps only the newest search running and drops stale results."""
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional
+
+import flet as ft
+
+
+class SearchTaskManager:
+    """
+    Runs one search at a time, tagged with a generation number.
+
+    Starting a search cancels the previous task (and with it any HTTP
+    requests it alone was waiting on). Code that awaited something checks
+    is_current(generation) before touching shared state, so a result that
+    arrives after a newer search began is dropped instead of painted.
+    """
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self.generation = 0
+        self._future: Optional[Future] = None
+        self._live = False  # whether _future is a search-as-you-type lookup
+
+        # Statistics
+        self.started = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self.wasted_requests = 0
+
+    def claim(self) -> int:
+        """Supersede whatever is running and return the new generation."""
+        if self._future is not None and not self._future.done():
+            if self._future.cancel():
+                self.cancelled += 1
+        self._future = None
+        self._live = False
+        self.generation += 1
+        return self.generation
+
+    def start(self, handler: Callable[..., Awaitable], *args: Any, live: bool = False) -> int:
+        """Run handler(generation, *args) as the current search; `live` marks a type-ahead lookup."""
+        generation = self.claim()
+        self.started += 1
+        self._future = self.page.run_task(handler, generation, *args)
+        self._live = live
+        return generation
+
+    def cancel_live(self) -> bool:
+        """Supersede the current search only if it is a live lookup still in flight."""
+        if self._live and self._future is not None and not self._future.done():
+            self.claim()
+            return True
+        return False
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self.generation
+
+    def discard(self, requests: int, late: bool = False):
+        """Record lookups whose results were never shown."""
+        self.wasted_requests += requests
+        if late:
+            self.dropped += 1
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "started": self.started,
+            "cancelled": self.cancelled,
+            "dropped": self.dropped,
+            "wasted_requests": self.wasted_requests,
+        }
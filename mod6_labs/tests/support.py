@@ -0,0 +1,206 @@
+"""Shared fixtures: canned API payloads, a mock transport and a headless Flet page."""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+
+# config.py validates the key at import time
+os.environ.setdefault("OPENWEATHER_API_KEY", "test-key")
+
+import httpx
+from flet.core.local_connection import LocalConnection
+from flet.core.page import Page
+from flet.core.protocol import PageCommandResponsePayload, PageCommandsBatchResponsePayload
+
+import main
+from config import Config
+
+
+def weather_payload(city: str, temp: float = 25.5, condition: str = "Clouds", tz: int = 28800) -> Dict:
+    return {
+        "name": city,
+        "sys": {"country": "PH"},
+        "timezone": tz,
+        "weather": [{"main": condition, "description": "few clouds", "icon": "02d"}],
+        "main": {"temp": temp, "feels_like": temp + 0.5, "humidity": 70, "pressure": 1010},
+        "clouds": {"all": 20},
+        "wind": {"speed": 3.1},
+    }
+
+
+def forecast_payload(city: str, start: Optional[int] = None, count: int = 40,
+                     step: int = 10800, tz: Optional[int] = 28800) -> Dict:
+    start = int(time.time()) if start is None else start
+    return {
+        "cod": "200",
+        "cnt": count,
+        "list": [
+            {
+                "dt": start + i * step,
+                "main": {"temp": 20 + i % 7, "feels_like": 19, "humidity": 50},
+                "weather": [{"main": "Clear", "description": "clear sky", "icon": "01d"}],
+            }
+            for i in range(count)
+        ],
+        "city": {"name": city, "country": "PH", "timezone": tz},
+    }
+
+
+class MockApi:
+    """
+    Answers weather and forecast requests in-process and counts them.
+
+    `delay` is awaited inside the transport, so a slow API can be
+    simulated without sockets. Responses carry an ETag, and a conditional
+    request for an unchanged body gets a 304. The city "Nowhere" is a 404.
+    With `chunk_size`, bodies arrive in chunks of that many bytes.
+    """
+
+    def __init__(self, delay: float = 0.0, temp: float = 25.5, chunk_size: Optional[int] = None):
+        self.delay = delay
+        self.temp = temp
+        self.chunk_size = chunk_size
+        self.start = int(time.time())  # forecasts stay identical until changed
+        self.requests: List[httpx.Request] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        params = request.url.params
+        city = params.get("q") or f"{params.get('lat')},{params.get('lon')}"
+        if city.lower() == "nowhere":
+            return httpx.Response(404, json={"cod": "404", "message": "city not found"})
+        if request.url.path.endswith("forecast"):
+            body = forecast_payload(city, start=self.start)
+        else:
+            body = weather_payload(city, temp=self.temp)
+        content = json.dumps(body).encode()
+        etag = f'"{zlib.crc32(content):08x}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag, "Content-Type": "application/json"}
+        if self.chunk_size:
+            return httpx.Response(200, content=self._chunks(content), headers=headers)
+        return httpx.Response(200, content=content, headers=headers)
+
+    async def _chunks(self, content: bytes):
+        for i in range(0, len(content), self.chunk_size):
+            yield content[i:i + self.chunk_size]
+            await asyncio.sleep(0)
+
+    @property
+    def count(self) -> int:
+        return len(self.requests)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def install(self, service):
+        """Route a WeatherService's shared client through this mock."""
+        service._client = self.client()
+
+
+class FakeConnection(LocalConnection):
+    """A Flet connection that applies commands locally instead of talking to a client."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+        self.bytes = 0
+
+    def _record(self, messages):
+        if messages:
+            self.batches += 1
+            self.bytes += len(json.dumps(messages, default=lambda o: o.__dict__))
+
+    def send_commands(self, session_id, commands):
+        results, messages = [], []
+        for command in commands:
+            if command.name == "get":
+                results.append("")
+                continue
+            result, message = self._process_command(command)
+            if command.name == "add":
+                results.append(result)
+            if message:
+                messages.append(message)
+        self._record(messages)
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        if command.name == "get":
+            return PageCommandResponsePayload(result="", error="")
+        result, message = self._process_command(command)
+        self._record([message] if message else [])
+        return PageCommandResponsePayload(result=result, error="")
+
+
+def make_page(loop: asyncio.AbstractEventLoop) -> Page:
+    return Page(FakeConnection(), "test-session", loop)
+
+
+async def settle(seconds: float = 0.0):
+    """Let scheduled callbacks, tasks and coalesced updates run."""
+    await asyncio.sleep(seconds)
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class AppTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Runs a WeatherApp on a headless page against a MockApi.
+
+    Each test gets its own working directory (history file, disk cache)
+    and can override Config values through `config`. A non-empty `history`
+    is saved before the app starts, as if from an earlier session.
+    """
+
+    api_delay = 0.0
+    config: Dict = {}
+    history: List[str] = []
+
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        overrides = {
+            "DISK_CACHE_ENABLED": False,
+            "AUTO_REFRESH_ENABLED": False,
+            "ANIMATION_POLICY": "none",
+            "GAZETTEER_PATH": "cities.tsv",
+            "HISTORY_SAVE_DELAY": 0.0,
+            "RATE_LIMIT_BURST": 1000,
+            "LIVE_SEARCH_DEBOUNCE_MS": 50,
+        }
+        overrides.update(self.config)
+        self._config = mock.patch.multiple(Config, **overrides)
+        self._config.start()
+
+        if self.history:
+            Path("search_history.json").write_text(json.dumps(self.history))
+
+        self.api = MockApi(delay=self.api_delay)
+        self.page = make_page(asyncio.get_running_loop())
+        self.app = main.WeatherApp(self.page)
+        self.api.install(self.app.weather_service)
+
+    async def asyncTearDown(self):
+        await self.app.on_page_close(None)
+        self._config.stop()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def search(self, city: str):
+        """Submit a search and wait for it to finish painting."""
+        self.app.perform_search(city)
+        await settle()
+        await asyncio.wrap_future(self.app.searches._future)
+        await settle()
@@ -0,0 +1,136 @@
+"""DiskCache: WAL storage, and WeatherService keeping its writes off the event loop."""
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import MockApi
+
+from config import Config
+from disk_cache import DiskCache
+from weather_service import WeatherService
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmp.name) / "cache.db")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def open(self, max_age=3600, max_entries=10) -> DiskCache:
+        cache = DiskCache(self.path, max_age=max_age, max_entries=max_entries)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_round_trip(self):
+        cache = self.open()
+        cache.set(("weather", "paris"), {"temp": 10})
+        payload, fetched_at = cache.get(("weather", "paris"))
+        self.assertEqual(payload, {"temp": 10})
+        self.assertAlmostEqual(fetched_at, time.time(), delta=5)
+        self.assertIsNone(cache.get(("weather", "lima")))
+
+    def test_uses_wal_with_normal_sync(self):
+        cache = self.open()
+        self.assertEqual(cache.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(cache.conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+
+    def test_constructor_does_not_compact(self):
+        cache = self.open(max_age=60)
+        cache.set("old", {}, fetched_at=time.time() - 3600)
+        cache.close()
+
+        cache = self.open(max_age=60)
+        self.assertIsNotNone(cache.get("old"))
+        self.assertEqual(cache.compact(), 1)
+        self.assertIsNone(cache.get("old"))
+
+    def test_compact_keeps_newest_entries(self):
+        cache = self.open(max_entries=3)
+        now = time.time()
+        for i in range(5):
+            cache.set(f"k{i}", {"i": i}, fetched_at=now - 100 + i)
+        self.assertEqual(cache.compact(), 2)
+        self.assertEqual([cache.get(f"k{i}") is not None for i in range(5)], [False, False, True, True, True])
+
+    def test_threads_share_the_database(self):
+        cache = self.open()
+        writer = threading.Thread(target=cache.set, args=("k", {"from": "thread"}))
+        writer.start()
+        writer.join()
+        self.assertEqual(cache.get("k")[0], {"from": "thread"})
+
+
+class TestWeatherServiceDiskWrites(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._config = mock.patch.multiple(
+            Config, DISK_CACHE_ENABLED=True, DISK_CACHE_PATH=str(Path(self._tmp.name) / "cache.db")
+        )
+        self._config.start()
+        self.service = WeatherService()
+        self.api = MockApi()
+        self.api.install(self.service)
+
+        # Record which thread each disk write runs on
+        self.threads = []
+        for name in ("set", "touch", "compact"):
+            original = getattr(self.service.disk_cache, name)
+
+            def record(*args, _name=name, _original=original):
+                self.threads.append((_name, threading.current_thread()))
+                return _original(*args)
+
+            setattr(self.service.disk_cache, name, record)
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        self._config.stop()
+        self._tmp.cleanup()
+
+    async def test_writes_and_compaction_run_off_the_loop(self):
+        await self.service.get_weather("Paris")
+        await self.service.get_weather("Paris", revalidate=True)  # 304, touch
+        await self.service.aclose()
+
+        self.assertEqual([name for name, _ in self.threads], ["compact", "set", "touch"])
+        loop_thread = threading.current_thread()
+        self.assertTrue(all(thread is not loop_thread for _, thread in self.threads))
+        self.assertIsNotNone(self.service.disk_cache.get(
+            self.service._cache_key(self.service.base_url, {"q": "Paris", "units": Config.UNITS})
+        ))
+
+    async def test_compaction_runs_once(self):
+        await self.service.get_weather("Paris")
+        await self.service.get_weather("Lima")
+        await self.service.aclose()
+        self.assertEqual([name for name, _ in self.threads].count("compact"), 1)
+
+    async def test_aclose_releases_the_worker_and_connections(self):
+        await self.service.get_weather("Paris")
+        worker = next(thread for name, thread in self.threads if name == "set")
+        await self.service.aclose()
+
+        self.assertFalse(worker.is_alive())
+        self.assertIsNone(self.service._disk_executor)
+        self.assertEqual(self.service.disk_cache._connections, [])
+
+    async def test_service_is_usable_after_aclose(self):
+        await self.service.get_weather("Paris")
+        await self.service.aclose()
+        self.api.install(self.service)
+
+        await self.service.get_weather("Lima")
+        await self.service.aclose()
+        key = self.service._cache_key(self.service.base_url, {"q": "Lima", "units": Config.UNITS})
+        self.assertIsNotNone(self.service.disk_cache.get(key))
+        self.assertEqual([name for name, _ in self.threads], ["compact", "set", "set"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""ForecastAggregator: day buckets in the forecast city's UTC offset."""
+
+import unittest
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+from tests.support import forecast_payload
+
+from forecast import ForecastAggregator
+from models import Forecast
+
+HOUR = 3600
+
+
+def utc(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+def local_date(ts: int, offset: int) -> date:
+    return datetime.fromtimestamp(ts, timezone(timedelta(seconds=offset))).date()
+
+
+class OffsetCases:
+    """Checks shared by every fixed UTC offset; subclasses set `offset`."""
+
+    offset = 0
+
+    def midnight_utc(self, day: date) -> int:
+        """The UTC timestamp of local midnight starting `day`."""
+        return utc(day.year, day.month, day.day) - self.offset
+
+    def test_midnight_boundary(self):
+        aggregator = ForecastAggregator(self.offset)
+        midnight = self.midnight_utc(date(2024, 1, 16))
+        aggregator.add(midnight - 1, 10.0)
+        aggregator.add(midnight, 20.0)
+
+        before, after = aggregator.days()
+        self.assertEqual((before.weekday, before.high), ("Mon", 10.0))
+        self.assertEqual((after.weekday, after.high), ("Tue", 20.0))
+        self.assertEqual(after.day - before.day, 1)
+
+    def test_buckets_match_local_calendar_dates(self):
+        forecast = Forecast.from_payload(forecast_payload("X", start=utc(2024, 3, 1, 1), tz=self.offset))
+        aggregator = ForecastAggregator.for_forecast(forecast)
+
+        expected = defaultdict(list)
+        for point in forecast.points:
+            expected[local_date(point.dt, self.offset)].append(point.temp)
+
+        days = aggregator.days()
+        self.assertEqual(len(days), len(expected))
+        for summary, (day, temps) in zip(days, sorted(expected.items())):
+            self.assertEqual(summary.weekday, day.strftime("%a"))
+            self.assertEqual((summary.high, summary.low), (max(temps), min(temps)))
+            self.assertEqual(summary.count, len(temps))
+
+    def test_today_index_follows_local_date(self):
+        aggregator = ForecastAggregator(self.offset)
+        now = utc(2024, 6, 30, 12, 15)
+        today = local_date(now, self.offset)
+        self.assertEqual(aggregator.today_index(now), (today - date(1970, 1, 1)).days)
+
+    def test_out_of_order_entries(self):
+        aggregator = ForecastAggregator(self.offset)
+        midnight = self.midnight_utc(date(2024, 1, 16))
+        for dt, temp in [(midnight + HOUR, 5.0), (midnight - HOUR, 7.0), (midnight + 2 * HOUR, 9.0)]:
+            aggregator.add(dt, temp)
+
+        before, after = aggregator.days()
+        self.assertEqual((before.high, before.count), (7.0, 1))
+        self.assertEqual((after.low, after.high, after.count), (5.0, 9.0, 2))
+
+
+class TestPlusThirteen(OffsetCases, unittest.TestCase):
+    offset = 13 * HOUR  # Tonga, Samoa: local midnight is 11:00 UTC the day before
+
+
+class TestMinusTen(OffsetCases, unittest.TestCase):
+    offset = -10 * HOUR  # Hawaii: local midnight is 10:00 UTC
+
+
+class TestPlusFiveThirty(OffsetCases, unittest.TestCase):
+    offset = 5 * HOUR + 30 * 60  # India: a half-hour offset
+
+
+class TestOffsets(unittest.TestCase):
+    def test_same_instant_lands_on_different_days(self):
+        now = utc(2024, 1, 15, 11, 30)  # Mon 11:30 UTC
+        tonga = ForecastAggregator(13 * HOUR)
+        hawaii = ForecastAggregator(-10 * HOUR)
+        tonga.add(now, 1.0)
+        hawaii.add(now, 1.0)
+
+        self.assertEqual(tonga.days()[0].weekday, "Tue")  # 00:30 Tuesday
+        self.assertEqual(hawaii.days()[0].weekday, "Mon")  # 01:30 Monday
+        self.assertEqual(tonga.today_index(now) - hawaii.today_index(now), 1)
+
+    def test_fallback_offset_when_payload_has_none(self):
+        forecast = Forecast.from_payload(forecast_payload("X", start=utc(2024, 1, 15, 11), count=1, tz=None))
+        self.assertEqual(ForecastAggregator.for_forecast(forecast, fallback_offset=13 * HOUR).tz_offset, 13 * HOUR)
+        self.assertEqual(ForecastAggregator.for_forecast(forecast).tz_offset, 0)
+
+    def test_payload_offset_stays_fixed_across_dst_change(self):
+        # New York leaves EDT (-4h) for EST (-5h) at 06:00 UTC on 2024-11-03.
+        # The API reports the offset once, at fetch time, and it is applied to the whole window.
+        edt = -4 * HOUR
+        forecast = Forecast.from_payload(
+            forecast_payload("New York", start=utc(2024, 11, 2, 12), count=16, step=3 * HOUR, tz=edt)
+        )
+        aggregator = ForecastAggregator.for_forecast(forecast, fallback_offset=-5 * HOUR)
+        self.assertEqual(aggregator.tz_offset, edt)
+
+        # 04:30 UTC on Nov 4 is 23:30 EST on Nov 3, but 00:30 on Nov 4 at the fixed EDT offset
+        late = utc(2024, 11, 4, 4, 30)
+        self.assertEqual(aggregator.day_index(late), (date(2024, 11, 4) - date(1970, 1, 1)).days)
+
+        expected = defaultdict(int)
+        for point in forecast.points:
+            expected[local_date(point.dt, edt)] += 1
+        self.assertEqual([day.count for day in aggregator.days()], [expected[d] for d in sorted(expected)])
+        self.assertEqual([day.weekday for day in aggregator.days()], ["Sat", "Sun", "Mon"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Forecast cards: redraws reuse one pool of controls."""
+
+import gc
+import time
+import unittest
+
+from tests.support import AppTestCase, forecast_payload
+
+from models import Forecast
+
+
+class TestForecastRedraw(AppTestCase):
+    async def test_thousand_redraws_keep_registry_size(self):
+        await self.search("Paris")
+        gc.collect()
+        registered = len(self.app.theme_registry)
+        self.assertGreater(registered, 0)
+        cards = list(self.app.forecast_row.controls)
+
+        now = int(time.time())
+        for i in range(1000):
+            # Vary the payload so the number of days (and cards in use) changes
+            payload = forecast_payload("Paris", start=now + i * 60, count=8 + i % 33)
+            await self.app.process_and_display_forecast(Forecast.from_payload(payload), animate=False)
+        gc.collect()
+
+        self.assertEqual(len(self.app.theme_registry), registered)
+        self.assertEqual(self.app.forecast_row.controls, cards)
+        self.assertLessEqual(len(self.app.forecast_text_controls), len(cards))
+
+
+class TestTodayRange(AppTestCase):
+    def today_card(self):
+        return next(item for item in self.app.forecast_text_controls if item["today"])
+
+    async def refresh(self, temp: float):
+        self.api.temp = temp
+        before = self.api.count
+        await self.app.refresh_current_city()
+        self.assertEqual(self.api.count - before, 2)
+        self.assertEqual(self.app.weather_service.not_modified, 1)  # forecast unchanged
+
+    async def test_current_temperature_widens_todays_card(self):
+        await self.search("Paris")
+        card = self.today_card()
+        low = card["low"]
+
+        await self.refresh(40.0)
+
+        self.assertEqual(card["high"], 40.0)
+        self.assertEqual(card["control"].value, f"40°/{round(low)}°")
+        self.assertIn("40.0°C", self.app.high_low_text.value)
+
+    async def test_unchanged_range_leaves_todays_card_alone(self):
+        await self.search("Paris")
+        card = self.today_card()
+        value = card["control"].value
+
+        await self.refresh(self.api.temp + 0.1)
+
+        self.assertEqual(card["control"].value, value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Gazetteer: prefix completion ranking and name resolution."""
+
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import gazetteer
+from gazetteer import Gazetteer, build, normalize
+
+
+def geonames_row(name: str, country: str, population: int, lat: float = 0.0, lon: float = 0.0) -> str:
+    """One line in the GeoNames dump layout (19 tab-separated columns)."""
+    fields = [""] * 19
+    fields[1], fields[4], fields[5], fields[8], fields[14] = name, str(lat), str(lon), country, str(population)
+    return "\t".join(fields)
+
+
+class GazetteerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def load(self, rows) -> Gazetteer:
+        source = self.dir / "cities.txt"
+        source.write_text("\n".join(geonames_row(*row) for row in rows) + "\n", encoding="utf-8")
+        target = self.dir / "cities.tsv"
+        with redirect_stdout(StringIO()):
+            build(source, target)
+        places = Gazetteer(target)
+        self.addCleanup(places.close)
+        return places
+
+
+class TestComplete(GazetteerTestCase):
+    def test_busy_prefix_ranks_by_population(self):
+        rows = [(f"Lona{i:04d}", "XX", 500 + i) for i in range(300)]
+        rows += [("London", "GB", 8_900_000), ("Londrina", "BR", 575_000), ("Long Beach", "US", 466_000)]
+        places = self.load(rows)
+
+        names = [place.name for place in places.complete("lon", limit=3)]
+        self.assertEqual(names, ["London", "Londrina", "Long Beach"])
+        self.assertEqual(places.complete("LON")[0].name, "London")
+
+    def test_matches_brute_force_ranking(self):
+        rng = random.Random(7)
+        syllables = ["san", "ta", "lo", "ma", "ri", "a", "no", "ca"]
+        rows = [
+            ("".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))).title(), "XX", rng.randint(0, 10**6))
+            for _ in range(5000)
+        ]
+        places = self.load(rows)
+
+        everything = [places._place(line) for line in places._scan(places._data(), b"", len(rows))]
+        for prefix in ["s", "sa", "san", "sant", "l", "lo", "lom", "a", "ca", "ma", "zz"]:
+            expected = sorted(
+                (place for place in everything if normalize(place.name).startswith(prefix)),
+                key=lambda place: place.population,
+                reverse=True,
+            )[:8]
+            got = places.complete(prefix)
+            self.assertEqual([p.population for p in got], [p.population for p in expected], prefix)
+
+    def test_limit_is_capped_for_ranked_prefixes(self):
+        places = self.load([(f"Lona{i:04d}", "XX", i) for i in range(300)])
+        self.assertEqual(len(places.complete("lon", limit=50)), gazetteer.TOP_K)
+        self.assertEqual(len(places.complete("lona00", limit=50)), 50)
+
+    def test_without_ranking_index_falls_back_to_a_scan(self):
+        places = self.load([("Paris", "FR", 2_100_000), ("Parma", "IT", 200_000)])
+        places.top_path.unlink()
+        self.assertEqual([p.name for p in places.complete("par")], ["Paris", "Parma"])
+
+    def test_missing_file(self):
+        places = Gazetteer(self.dir / "missing.tsv")
+        self.assertFalse(places.available)
+        self.assertEqual(places.complete("lon"), [])
+        self.assertIsNone(places.resolve("London"))
+
+
+class TestResolve(GazetteerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.places = self.load([
+            ("Paris", "FR", 2_100_000, 48.85, 2.35),
+            ("Paris", "US", 25_000, 33.66, -95.55),
+            ("São Paulo", "BR", 12_300_000, -23.55, -46.63),
+        ])
+
+    def test_ambiguous_name_picks_most_populous(self):
+        self.assertEqual(self.places.resolve("paris").country, "FR")
+
+    def test_country_suffix(self):
+        place = self.places.resolve("Paris, us")
+        self.assertEqual((place.country, place.lat), ("US", 33.66))
+
+    def test_accents_and_case_are_ignored(self):
+        self.assertEqual(self.places.resolve("SAO PAULO").name, "São Paulo")
+
+    def test_prefix_is_not_a_match(self):
+        self.assertIsNone(self.places.resolve("Par"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""History persistence: atomic writes survive a killed writer."""
+
+import asyncio
+import json
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import codec
+from history_store import HistoryWriter, write_atomic
+
+MODULE_DIR = Path(__file__).resolve().parent.parent
+
+# Saves a new history but SIGKILLs itself at the stage named by argv[2]:
+# halfway through writing the bytes, right after fsync, or just before the rename
+WRITER_SCRIPT = """
+import builtins, os, signal, sys
+from pathlib import Path
+import codec
+import history_store
+
+path, stage = Path(sys.argv[1]), sys.argv[2]
+
+def die():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+if stage == "write":
+    real_open = builtins.open
+
+    class HalfWriter:
+        def __init__(self, f):
+            self.f = f
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            self.f.close()
+        def write(self, data):
+            self.f.write(data[:len(data) // 2])
+            self.f.flush()
+            die()
+
+    builtins.open = lambda *args, **kwargs: HalfWriter(real_open(*args, **kwargs))
+elif stage == "fsync":
+    real_fsync = os.fsync
+    history_store.os.fsync = lambda fd: (real_fsync(fd), die())
+elif stage == "replace":
+    history_store.os.replace = lambda *args: die()
+
+history_store.write_atomic(path, codec.dumps(["Lima", "Paris"] * 1000, pretty=True))
+"""
+
+
+class HistoryStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "search_history.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def read(self):
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+
+class TestWriteAtomic(HistoryStoreTestCase):
+    def test_replaces_contents(self):
+        write_atomic(self.path, codec.dumps(["Paris"]))
+        write_atomic(self.path, codec.dumps(["Lima", "Paris"]))
+        self.assertEqual(self.read(), ["Lima", "Paris"])
+
+    def test_failure_before_replace_keeps_previous_history(self):
+        write_atomic(self.path, codec.dumps(["Paris"]))
+        with mock.patch("history_store.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, codec.dumps(["Lima", "Paris"]))
+        self.assertEqual(self.read(), ["Paris"])
+
+    @unittest.skipUnless(hasattr(signal, "SIGKILL"), "needs SIGKILL")
+    def test_killed_writer_keeps_previous_history(self):
+        write_atomic(self.path, codec.dumps(["Paris"]))
+        for stage in ("write", "fsync", "replace"):
+            with self.subTest(stage=stage):
+                writer = subprocess.run(
+                    [sys.executable, "-c", WRITER_SCRIPT, str(self.path), stage],
+                    cwd=MODULE_DIR,
+                )
+                self.assertEqual(writer.returncode, -signal.SIGKILL)
+                self.assertEqual(self.read(), ["Paris"])
+
+        # The next save goes through despite the leftover temp file
+        write_atomic(self.path, codec.dumps(["Lima", "Paris"]))
+        self.assertEqual(self.read(), ["Lima", "Paris"])
+
+
+class TestHistoryWriter(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "search_history.json"
+        self.writer = HistoryWriter(self.path, delay=0.05, loop=asyncio.get_running_loop())
+
+    async def asyncTearDown(self):
+        self._tmp.cleanup()
+
+    def read(self):
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    async def test_burst_is_coalesced_into_one_write(self):
+        for history in (["Paris"], ["Lima", "Paris"], ["Cebu", "Lima", "Paris"]):
+            self.writer.schedule(history)
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(self.writer.writes, 1)
+        self.assertEqual(self.writer.coalesced, 2)
+        self.assertEqual(self.read(), ["Cebu", "Lima", "Paris"])
+
+    async def test_flush_writes_pending_snapshot_at_once(self):
+        self.writer.schedule(["Paris"])
+        await self.writer.flush()
+        self.assertEqual(self.read(), ["Paris"])
+        await self.writer.flush()
+        self.assertEqual(self.writer.writes, 1)
+
+    async def test_failed_flush_keeps_previous_history(self):
+        write_atomic(self.path, codec.dumps(["Paris"]))
+        self.writer.schedule(["Lima", "Paris"])
+        with mock.patch("history_store.os.replace", side_effect=OSError("killed")):
+            with redirect_stdout(StringIO()) as out:
+                await self.writer.flush()
+
+        self.assertIn("History Save Error", out.getvalue())
+        self.assertEqual(self.read(), ["Paris"])
+        self.assertEqual(self.writer.writes, 0)
+
+    async def test_created_off_the_event_loop(self):
+        # WeatherApp (and with it the writer) is built in one of Flet's handler threads
+        loop = asyncio.get_running_loop()
+        created = []
+        thread = threading.Thread(target=lambda: created.append(HistoryWriter(self.path, 0.01, loop)))
+        thread.start()
+        thread.join()
+
+        writer = created[0]
+        writer.schedule(["Paris"])
+        await writer.flush()
+        self.assertEqual(self.read(), ["Paris"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""History taps: paint from cache, then revalidate against the API."""
+
+import time
+import unittest
+
+from tests.support import AppTestCase, forecast_payload, settle, weather_payload
+
+from config import Config
+
+
+class TestHistoryTap(AppTestCase):
+    config = {"DISK_CACHE_ENABLED": True}
+
+    def store(self, city: str, age: float, temp: float):
+        """Put a city in the disk cache as if it had been fetched `age` seconds ago."""
+        service = self.app.weather_service
+        fetched_at = time.time() - age
+        for url, payload in (
+            (service.base_url, weather_payload(city, temp=temp)),
+            (service.forecast_url, forecast_payload(city)),
+        ):
+            key = service._cache_key(url, {"q": city, "units": Config.UNITS})
+            service.disk_cache.set(key, payload, fetched_at)
+
+    async def tap(self, city: str):
+        self.app.perform_search(city, instant=True)
+        await settle(0.1)
+
+    async def test_paints_without_waiting_for_the_network(self):
+        self.store("Paris", age=60, temp=10.0)
+        self.api.delay = 0.5
+        await self.tap("Paris")
+
+        self.assertEqual(self.app.current_city, "Paris")
+        self.assertEqual(self.app.main_temp_text.value, "10.0°C")
+        self.assertFalse(self.app.loading.visible)
+
+    async def test_stale_entry_is_revalidated_on_screen(self):
+        # Past the TTL but inside the stale-while-revalidate window
+        self.store("Paris", age=Config.WEATHER_CACHE_TTL + 60, temp=10.0)
+        self.api.temp = 18.0
+        await self.tap("Paris")
+
+        self.assertEqual(self.api.count, 2)
+        self.assertEqual(self.app.main_temp_text.value, "18.0°C")
+
+    async def test_unknown_city_falls_back_to_a_search(self):
+        await self.tap("Lima")
+
+        self.assertEqual(self.app.current_city, "Lima")
+        self.assertEqual(self.api.count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
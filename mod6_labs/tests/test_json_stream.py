@@ -0,0 +1,177 @@
+"""JsonArrayStream and WeatherService.stream_forecast: items out of a chunked body."""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from tests.support import MockApi, forecast_payload, settle
+
+from config import Config
+from json_stream import JsonArrayStream
+from resilience import CircuitBreaker
+from weather_service import WeatherService, WeatherServiceError
+
+
+def stream_items(body: bytes, splits, key: str = "list"):
+    """Feed `body` cut at the given offsets and collect every completed item."""
+    parser = JsonArrayStream(key)
+    items, start = [], 0
+    for end in list(splits) + [len(body)]:
+        items += parser.feed(body[start:end])
+        start = end
+    return items, parser
+
+
+class TestJsonArrayStream(unittest.TestCase):
+    def assertEveryTwoWaySplit(self, body: bytes, expected):
+        """Cutting the body at any single offset yields the same items."""
+        for cut in range(len(body) + 1):
+            items, _ = stream_items(body, [cut])
+            self.assertEqual(items, expected, f"split at {cut}: {body[:cut]!r} | {body[cut:]!r}")
+
+    def test_forecast_payload_in_any_chunk_size(self):
+        payload = forecast_payload("Paris", count=12)
+        body = json.dumps(payload).encode()
+        for size in (1, 2, 3, 7, 64, len(body)):
+            items, parser = stream_items(body, range(size, len(body), size))
+            self.assertEqual(items, payload["list"], size)
+            self.assertEqual(parser.items_seen, 12)
+
+    def test_splits_inside_strings_and_escapes(self):
+        entries = [
+            {"dt": 1, "note": 'quote \\" backslash \\\\ tab \t end'},
+            {"dt": 2, "note": "unicode é中 and \\u escape"},
+            {"dt": 3, "note": "\\"},
+        ]
+        body = json.dumps({"list": entries}).encode()
+        self.assertIn(b'\\\\"', body)  # an escaped backslash right before a closing quote
+        self.assertEveryTwoWaySplit(body, entries)
+
+    def test_structural_characters_inside_strings(self):
+        entries = [{"dt": 1, "text": '} ] { [ "list": [ {"x": 1}'}]
+        payload = {
+            "message": 'a decoy "list": [{"decoy": true}] with } and ]',
+            "cod": "200",
+            "list": entries,
+            "tail": "[{not an item}]",
+        }
+        body = json.dumps(payload).encode()
+        self.assertEveryTwoWaySplit(body, entries)
+
+    def test_nested_list_key_before_the_top_level_one(self):
+        payload = {
+            "city": {"name": "Paris", "list": [{"nested": True}], "deeper": {"list": [[1]]}},
+            "list": [{"dt": 1}, {"dt": 2}],
+        }
+        body = json.dumps(payload).encode()
+        self.assertEveryTwoWaySplit(body, [{"dt": 1}, {"dt": 2}])
+
+    def test_only_the_top_level_array_is_read(self):
+        body = json.dumps({"list": [{"dt": 1}], "other": [{"dt": 2}], "list2": [{"dt": 3}]}).encode()
+        self.assertEqual(stream_items(body, [])[0], [{"dt": 1}])
+
+    def test_empty_array(self):
+        for text in ('{"list": []}', '{"list":[],"city":{"list":[{"dt":1}]}}', '{"cod":"200","list" : [ ] }'):
+            body = text.encode()
+            for cut in range(len(body) + 1):
+                items, parser = stream_items(body, [cut])
+                self.assertEqual(items, [])
+                self.assertEqual(parser.items_seen, 0)
+
+    def test_array_items(self):
+        body = b'{"list": [[1, [2]], [], [{"a": "]"}]]}'
+        self.assertEveryTwoWaySplit(body, [[1, [2]], [], [{"a": "]"}]])
+
+    def test_custom_key(self):
+        body = b'{"list": [{"no": 1}], "hourly": [{"dt": 5}]}'
+        self.assertEqual(stream_items(body, [3, 20], key="hourly")[0], [{"dt": 5}])
+
+    def test_items_are_returned_as_soon_as_they_close(self):
+        parser = JsonArrayStream()
+        self.assertEqual(parser.feed(b'{"list": [{"dt": 1}, {"dt"'), [{"dt": 1}])
+        self.assertEqual(parser.feed(b': 2}'), [{"dt": 2}])
+        self.assertEqual(parser.feed(b']}'), [])
+
+
+class TestStreamForecast(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._config = mock.patch.multiple(Config, DISK_CACHE_ENABLED=False, RATE_LIMIT_BURST=1000)
+        self._config.start()
+        self.api = MockApi(chunk_size=97)
+        self.api.start = 1_700_000_000
+        self.service = WeatherService()
+        self.api.install(self.service)
+        self.breaker = self.service._breaker_for(self.service.forecast_url)
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        self._config.stop()
+
+    def half_open(self):
+        """Put the breaker where the next request is its single trial."""
+        self.breaker.state = CircuitBreaker.OPEN
+        self.breaker.opened_at = -Config.CIRCUIT_RESET_TIMEOUT
+
+    async def test_yields_every_point(self):
+        points = [point async for point in self.service.stream_forecast("Paris")]
+        expected = forecast_payload("Paris", start=self.api.start)["list"]
+        self.assertEqual([(p.dt, p.temp) for p in points], [(e["dt"], e["main"]["temp"]) for e in expected])
+
+    async def test_not_found(self):
+        with self.assertRaisesRegex(WeatherServiceError, "City 'Nowhere' not found"):
+            async for _ in self.service.stream_forecast("Nowhere"):
+                pass
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+
+    async def test_not_found_releases_trial(self):
+        self.half_open()
+        with self.assertRaises(WeatherServiceError):
+            async for _ in self.service.stream_forecast("Nowhere"):
+                pass
+        self.assertFalse(self.breaker._trial_in_flight)
+        self.assertTrue(self.breaker.allow_request())
+
+    async def test_early_aclose(self):
+        self.half_open()
+        stream = self.service.stream_forecast("Paris")
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        self.assertEqual(first.dt, self.api.start)
+        self.assertFalse(self.breaker._trial_in_flight)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        # The pooled client is still usable after abandoning a body mid-stream
+        self.assertEqual(len([p async for p in self.service.stream_forecast("Lima")]), 40)
+
+    async def test_cancel_before_response_releases_trial(self):
+        self.half_open()
+        self.api.delay = 0.5
+
+        async def consume():
+            async for _ in self.service.stream_forecast("Paris"):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await settle(0.05)
+        self.assertTrue(self.breaker._trial_in_flight)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertFalse(self.breaker._trial_in_flight)
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+    async def test_open_breaker_fails_fast(self):
+        self.breaker.state = CircuitBreaker.OPEN
+        self.breaker.opened_at = float("inf")
+        with self.assertRaisesRegex(WeatherServiceError, "temporarily unavailable"):
+            async for _ in self.service.stream_forecast("Paris"):
+                pass
+        self.assertEqual(self.api.count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
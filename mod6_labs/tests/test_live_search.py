@@ -0,0 +1,156 @@
+"""Live search: keystroke streams against a counting mock API."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from tests.support import AppTestCase, settle
+
+
+class LiveSearchTestCase(AppTestCase):
+    config = {"LIVE_SEARCH_ENABLED": True, "LIVE_SEARCH_DEBOUNCE_MS": 50}
+
+    async def type(self, text: str, gap: float = 0.01, start: int = 1):
+        """Feed on_city_change one keystroke at a time, as the SearchBar does."""
+        for i in range(start, len(text) + 1):
+            self.app.on_city_change(SimpleNamespace(data=text[:i]))
+            await asyncio.sleep(gap)
+
+    async def idle(self):
+        """Wait out the debounce and any lookup it started."""
+        await settle(0.1)
+        future = self.app.searches._future
+        if future is not None:
+            await asyncio.wrap_future(future)
+        await settle()
+
+
+class TestKeystrokeStreams(LiveSearchTestCase):
+    async def test_burst_sends_one_lookup(self):
+        await self.type("London")
+        await self.idle()
+
+        self.assertEqual(self.api.count, 2)  # weather + forecast
+        self.assertEqual(self.app.current_city, "London")
+        self.assertEqual(self.app.live_search.fired, 1)
+
+    async def test_pause_mid_word_sends_one_lookup_per_pause(self):
+        await self.type("Lon")
+        await self.idle()
+        await self.type("London", start=4)
+        await self.idle()
+
+        self.assertEqual(self.api.count, 4)
+        self.assertEqual(self.app.current_city, "London")
+
+    async def test_short_queries_send_nothing(self):
+        await self.type("Lo")
+        await self.idle()
+
+        self.assertEqual(self.api.count, 0)
+        self.assertIsNone(self.app.current_city)
+
+    async def test_retyping_current_city_sends_nothing(self):
+        await self.type("Paris")
+        await self.idle()
+        self.app.on_city_change(SimpleNamespace(data="Pari"))
+        self.app.on_city_change(SimpleNamespace(data="Paris"))
+        await self.idle()
+
+        self.assertEqual(self.api.count, 2)
+
+
+class TestKeystrokesDuringSearch(LiveSearchTestCase):
+    api_delay = 0.2
+
+    async def test_keystrokes_do_not_cancel_submitted_search(self):
+        self.app.perform_search("Paris")
+        await settle(0.05)
+        await self.type("Be")  # below LIVE_SEARCH_MIN_CHARS, never starts a lookup
+        await self.idle()
+
+        self.assertEqual(self.app.searches.cancelled, 0)
+        self.assertEqual(self.app.current_city, "Paris")
+        self.assertFalse(self.app.loading.visible)
+        self.assertTrue(self.app.weather_container.visible)
+        self.assertIn("search", self.app.ui_updates.per_action)
+
+    async def test_keystrokes_do_not_cancel_history_tap(self):
+        await self.type("Paris", gap=0)
+        await self.idle()
+        self.app.perform_search("Lima")
+        await self.idle()
+        requests = self.api.count
+
+        self.app.perform_search("Paris", instant=True)
+        await self.type("P")
+        await self.idle()
+
+        self.assertEqual(self.app.searches.cancelled, 0)
+        self.assertEqual(self.app.current_city, "Paris")
+        self.assertFalse(self.app.loading.visible)
+        self.assertIn("history", self.app.ui_updates.per_action)  # painted from cache
+        self.assertEqual(self.api.count, requests + 2)  # then revalidated
+
+    async def test_superseded_search_restores_screen(self):
+        self.app.perform_search("Paris")
+        await self.idle()
+
+        self.app.perform_search("Lima")
+        await settle(0.05)
+        self.assertTrue(self.app.loading.visible)
+        self.app.searches.claim()
+        await settle(0.3)
+
+        self.assertEqual(self.app.searches.cancelled, 1)
+        self.assertFalse(self.app.loading.visible)
+        self.assertTrue(self.app.weather_container.visible)
+        self.assertEqual(self.app.weather_container.opacity, 1.0)
+        self.assertEqual(self.app.current_city, "Paris")
+        self.assertIsNone(self.app.ui_updates.action)
+
+    async def test_superseded_search_leaves_successor_action_open(self):
+        self.app.perform_search("Lima")
+        await settle(0.05)
+        self.app.perform_search("Cebu")
+        await settle(0.05)
+
+        self.assertEqual(self.app.ui_updates.action, "search")
+        await self.idle()
+        self.assertEqual(self.app.current_city, "Cebu")
+        self.assertIsNone(self.app.ui_updates.action)
+
+
+class TestKeystrokesDuringLiveLookup(LiveSearchTestCase):
+    # The lookup outlasts the pause that fired it, so it is still in flight
+    # when typing resumes and would land before the next debounce fires
+    config = {"LIVE_SEARCH_ENABLED": True, "LIVE_SEARCH_DEBOUNCE_MS": 150}
+    api_delay = 0.3
+
+    async def test_typing_cancels_live_lookup_in_flight(self):
+        painted = []
+        display = self.app.display_weather
+
+        async def record(data, animate=True):
+            painted.append(data.name)
+            await display(data, animate)
+
+        self.app.display_weather = record
+
+        await self.type("Lon")
+        await settle(0.35)  # debounce fired, lookup waiting on the API
+        self.assertEqual(self.api.count, 2)
+        await self.type("Lond", start=4)
+
+        self.assertEqual(self.app.searches.cancelled, 1)
+        self.assertFalse(self.app.loading.visible)
+        await settle(0.1)  # past when the "Lon" lookup would have answered
+        self.assertIsNone(self.app.current_city)
+
+        await self.idle()
+        self.assertEqual(painted, ["Lond"])
+        self.assertEqual(self.app.current_city, "Lond")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""PrefetchScheduler: background warming and cancellation."""
+
+import asyncio
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from tests.support import AppTestCase, MockApi, settle
+from tests.test_gazetteer import geonames_row
+
+from config import Config
+from gazetteer import Gazetteer, build
+from prefetch import PrefetchScheduler
+from weather_service import WeatherService
+
+
+class PrefetchTestCase(unittest.IsolatedAsyncioTestCase):
+    api_delay = 0.0
+
+    async def asyncSetUp(self):
+        self._config = mock.patch.multiple(Config, DISK_CACHE_ENABLED=False, RATE_LIMIT_BURST=1000)
+        self._config.start()
+        self.api = MockApi(delay=self.api_delay)
+        self.service = WeatherService()
+        self.api.install(self.service)
+        self.prefetcher = PrefetchScheduler(self.service, limit=3, concurrency=2)
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        self._config.stop()
+
+
+class TestPrefetch(PrefetchTestCase):
+    async def test_warms_first_limit_cities(self):
+        await self.prefetcher.run(["Paris", "Lima", "Cebu", "Oslo"])
+
+        self.assertEqual(self.prefetcher.warmed, 3)
+        self.assertEqual(self.api.count, 6)
+        self.assertIsNotNone(self.service.peek_weather("Cebu"))
+        self.assertIsNone(self.service.peek_weather("Oslo"))
+
+    async def test_known_cities_warm_the_coordinate_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, target = Path(tmp) / "cities.txt", Path(tmp) / "cities.tsv"
+            source.write_text(geonames_row("Paris", "FR", 2_100_000, 48.85, 2.35) + "\n", encoding="utf-8")
+            with redirect_stdout(StringIO()):
+                build(source, target)
+            self.prefetcher.gazetteer = Gazetteer(target)
+            try:
+                await self.prefetcher.run(["Paris", "Atlantis"])
+            finally:
+                self.prefetcher.gazetteer.close()
+
+        self.assertIsNotNone(self.service.peek_weather_by_coordinates(48.85, 2.35))
+        self.assertIsNotNone(self.service.peek_forecast_by_coordinates(48.85, 2.35))
+        self.assertIsNone(self.service.peek_weather("Paris"))
+        self.assertIsNotNone(self.service.peek_weather("Atlantis"))
+
+
+class TestPrefetchCancel(PrefetchTestCase):
+    api_delay = 0.2
+
+    async def test_cancel_from_handler_thread(self):
+        run = asyncio.ensure_future(self.prefetcher.run(["Paris", "Lima", "Cebu"]))
+        await settle(0.05)
+
+        await asyncio.to_thread(self.prefetcher.cancel)
+        with self.assertRaises(asyncio.CancelledError):
+            await run
+
+        self.assertEqual(self.prefetcher.cancelled, 1)
+        self.assertEqual(self.prefetcher.warmed, 0)
+        self.assertEqual(self.service.stats["inflight"], 0)
+
+    async def test_cancel_when_idle_is_a_no_op(self):
+        await asyncio.to_thread(self.prefetcher.cancel)
+        self.assertEqual(self.prefetcher.cancelled, 0)
+
+
+class TestStartupPrefetch(AppTestCase):
+    history = ["Paris", "Lima"]
+
+    async def test_cold_start_warms_the_top_city(self):
+        await settle(0.1)
+
+        # Nothing was cached to paint, so the prefetcher is what warms Paris
+        self.assertIsNone(self.app.current_city)
+        for city in self.history:
+            self.assertIsNotNone(self.app.weather_service.peek_weather(city))
+            self.assertIsNotNone(self.app.weather_service.peek_forecast(city))
+        self.assertEqual(self.api.count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
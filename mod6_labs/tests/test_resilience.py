@@ -0,0 +1,265 @@
+"""RetryPolicy, CircuitBreaker and the retrying fetch path in WeatherService."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from tests.support import MockApi, settle
+
+from config import Config
+from resilience import CircuitBreaker, RetryPolicy
+from weather_service import WeatherService, WeatherServiceError
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(attempts=2, base_delay=0.5, max_delay=4.0)
+
+    def test_backoff_is_jittered_and_capped(self):
+        for attempt, cap in ((0, 0.5), (1, 1.0)):
+            delays = [self.policy.delay(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= cap for d in delays), attempt)
+            self.assertGreater(len(set(delays)), 1)
+        policy = RetryPolicy(attempts=10, base_delay=0.5, max_delay=4.0)
+        self.assertTrue(all(policy.delay(8) <= 4.0 for _ in range(50)))
+
+    def test_attempts_run_out(self):
+        self.assertIsNone(self.policy.delay(2))
+        self.assertIsNone(self.policy.delay(2, retry_after=1.0))
+
+    def test_retry_after(self):
+        self.assertEqual(self.policy.delay(0, retry_after=3.0), 3.0)
+        self.assertEqual(self.policy.delay(1, retry_after=4.0), 4.0)
+        self.assertIsNone(self.policy.delay(0, retry_after=4.5))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(RetryPolicy.parse_retry_after("3"), 3.0)
+        self.assertEqual(RetryPolicy.parse_retry_after("0.25"), 0.25)
+        self.assertEqual(RetryPolicy.parse_retry_after("-1"), 0.0)
+        for value in (None, "", "Wed, 21 Oct 2015 07:28:00 GMT"):
+            self.assertIsNone(RetryPolicy.parse_retry_after(value))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        clock = mock.patch("resilience.time.monotonic", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    def trip(self):
+        for _ in range(3):
+            self.assertTrue(self.breaker.allow_request())
+            self.breaker.record_failure()
+
+    def test_opens_at_threshold(self):
+        for _ in range(2):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+    def test_success_resets_the_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_fails_fast_while_open(self):
+        self.trip()
+        self.now += 29
+        self.assertFalse(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.rejected, 2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+    def test_single_half_open_trial(self):
+        self.trip()
+        self.now += 30
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.stats["transitions"], {
+            "closed->open": 1, "open->half_open": 1, "half_open->closed": 1,
+        })
+
+    def test_failed_trial_reopens(self):
+        self.trip()
+        self.now += 30
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.now += 30
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_release_frees_the_trial(self):
+        self.trip()
+        self.now += 30
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.release()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+
+class TestFetchRetries(unittest.IsolatedAsyncioTestCase):
+    """WeatherService._fetch against a transport that answers from a script."""
+
+    async def asyncSetUp(self):
+        self._config = mock.patch.multiple(
+            Config,
+            DISK_CACHE_ENABLED=False,
+            RATE_LIMIT_BURST=1000,
+            RETRY_ATTEMPTS=2,
+            RETRY_BASE_DELAY=0.001,
+            RETRY_MAX_DELAY=0.5,
+            CIRCUIT_FAILURE_THRESHOLD=3,
+        )
+        self._config.start()
+        self.api = MockApi()
+        # Each entry is a status code, (status, headers) or an exception to raise;
+        # once the script runs out the API answers normally
+        self.script = []
+        handle = self.api.handle
+
+        async def scripted(request):
+            if not self.script:
+                return await handle(request)
+            self.api.requests.append(request)
+            step = self.script.pop(0)
+            if isinstance(step, Exception):
+                raise step
+            status, headers = step if isinstance(step, tuple) else (step, {})
+            return httpx.Response(status, headers=headers)
+
+        self.api.handle = scripted
+        self.service = WeatherService()
+        self.api.install(self.service)
+        self.breaker = self.service._breaker_for(self.service.base_url)
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        self._config.stop()
+
+    def half_open(self):
+        self.breaker.state = CircuitBreaker.OPEN
+        self.breaker.opened_at = -Config.CIRCUIT_RESET_TIMEOUT
+
+    async def test_retries_server_errors(self):
+        self.script = [503, 502]
+        result = await self.service.get_weather("Paris")
+
+        self.assertEqual(result.name, "Paris")
+        self.assertEqual(self.api.count, 3)
+        self.assertEqual(self.service.retries, 2)
+
+    async def test_retries_timeouts(self):
+        self.script = [httpx.ReadTimeout("slow"), httpx.ConnectError("refused")]
+        result = await self.service.get_weather("Paris")
+
+        self.assertEqual(result.name, "Paris")
+        self.assertEqual(self.service.retries, 2)
+
+    async def test_gives_up_after_the_last_attempt(self):
+        self.script = [503, 503, 503, 200]
+        with self.assertRaisesRegex(WeatherServiceError, "currently unavailable"):
+            await self.service.get_weather("Paris")
+        self.assertEqual(self.api.count, 3)
+
+    async def test_honours_retry_after(self):
+        self.script = [(429, {"Retry-After": "0.2"})]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await self.service.get_weather("Paris")
+
+        self.assertGreaterEqual(loop.time() - started, 0.2)
+        self.assertEqual(result.name, "Paris")
+        self.assertEqual(self.service.retries, 1)
+
+    async def test_rejects_retry_after_above_max_delay(self):
+        self.script = [(429, {"Retry-After": "30"})]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with self.assertRaisesRegex(WeatherServiceError, "Too many requests"):
+            await self.service.get_weather("Paris")
+
+        self.assertLess(loop.time() - started, 0.2)
+        self.assertEqual(self.api.count, 1)
+        self.assertEqual(self.service.retries, 0)
+
+    async def test_client_errors_are_not_retried(self):
+        self.script = [404]
+        with self.assertRaisesRegex(WeatherServiceError, "City 'Paris' not found"):
+            await self.service.get_weather("Paris")
+        self.assertEqual(self.api.count, 1)
+        self.assertEqual(self.breaker.failures, 0)
+
+    async def test_opens_at_threshold_then_fails_fast(self):
+        self.script = [503, 503, 503]
+        with self.assertRaises(WeatherServiceError):
+            await self.service.get_weather("Paris")
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaisesRegex(WeatherServiceError, "temporarily unavailable"):
+            await self.service.get_weather("Lima")
+        self.assertEqual(self.api.count, 3)
+        self.assertEqual(self.breaker.rejected, 1)
+
+    async def test_open_breaker_stops_retries(self):
+        # Two failures already on record: the first 503 trips the breaker
+        self.breaker.failures = 2
+        self.script = [503]
+        with self.assertRaisesRegex(WeatherServiceError, "temporarily unavailable"):
+            await self.service.get_weather("Paris")
+        self.assertEqual(self.api.count, 1)
+
+    async def test_single_half_open_trial(self):
+        self.half_open()
+        self.api.delay = 0.1
+        trial = asyncio.ensure_future(self.service.get_weather("Paris"))
+        await settle(0.02)
+
+        with self.assertRaisesRegex(WeatherServiceError, "temporarily unavailable"):
+            await self.service.get_weather("Lima")
+        self.assertEqual((await trial).name, "Paris")
+        self.assertEqual(self.api.count, 1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_failed_trial_reopens(self):
+        self.half_open()
+        self.script = [503]
+        with self.assertRaisesRegex(WeatherServiceError, "temporarily unavailable"):
+            await self.service.get_weather("Paris")
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.api.count, 1)
+
+    async def test_cancelled_trial_is_released(self):
+        self.half_open()
+        self.api.delay = 0.5
+        trial = asyncio.ensure_future(self.service.get_weather("Paris"))
+        await settle(0.05)
+        self.assertTrue(self.breaker._trial_in_flight)
+
+        trial.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await trial
+        await settle()
+
+        self.assertFalse(self.breaker._trial_in_flight)
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.api.delay = 0.0
+        self.assertEqual((await self.service.get_weather("Paris")).name, "Paris")
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
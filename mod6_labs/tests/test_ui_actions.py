@@ -0,0 +1,59 @@
+"""Per-action update accounting when user actions overlap."""
+
+import asyncio
+import unittest
+
+from tests.support import AppTestCase, make_page, settle
+
+from update_scheduler import UpdateScheduler
+
+
+class TestActionIds(unittest.IsolatedAsyncioTestCase):
+    async def test_replaced_action_cannot_close_its_successor(self):
+        updates = UpdateScheduler(make_page(asyncio.get_running_loop()))
+        first = updates.begin_action("toggle_unit")
+        second = updates.begin_action("search")
+
+        updates.end_action(first)
+        self.assertEqual(updates.action, "search")
+        self.assertNotIn("toggle_unit", updates.per_action)
+
+        updates.end_action(second)
+        self.assertIsNone(updates.action)
+        self.assertIn("search", updates.per_action)
+
+
+class TestOverlappingActions(AppTestCase):
+    config = {"ANIMATION_POLICY": "full"}
+
+    async def test_toggle_ending_mid_search_leaves_search_action_open(self):
+        await self.search("Paris")
+        self.app.ui_updates.per_action.clear()
+
+        toggle = asyncio.ensure_future(self.app.toggle_unit(None))  # 0.3 s cross-fade
+        await settle(0.05)
+        self.app.perform_search("Lima")  # staggered reveal outlasts the fade
+        await toggle
+
+        self.assertEqual(self.app.ui_updates.action, "search")
+        self.assertEqual(self.app.ui_updates.per_action, {})
+
+        await asyncio.wrap_future(self.app.searches._future)
+        self.assertIsNone(self.app.ui_updates.action)
+        self.assertEqual(list(self.app.ui_updates.per_action), ["search"])
+
+    async def test_toggle_started_mid_search_is_recorded(self):
+        await self.search("Paris")
+        self.app.ui_updates.per_action.clear()
+
+        self.app.perform_search("Lima")
+        await settle(0.05)
+        await self.app.toggle_unit(None)  # takes over accounting from the search
+        await asyncio.wrap_future(self.app.searches._future)
+
+        self.assertIsNone(self.app.ui_updates.action)
+        self.assertIn("toggle_unit", self.app.ui_updates.per_action)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""WeatherService: batch lookups, rate-limit lanes and single-flight coalescing."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from tests.support import MockApi, settle
+
+from config import Config
+from rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from weather_service import WeatherService
+
+
+class WeatherServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._config = mock.patch.multiple(Config, DISK_CACHE_ENABLED=False, RATE_LIMIT_BURST=1000)
+        self._config.start()
+        self.api = MockApi()
+        self.service = WeatherService()
+        self.api.install(self.service)
+
+        self.lanes = []
+        acquire = self.service.rate_limiter.acquire
+
+        async def record(priority=PRIORITY_INTERACTIVE):
+            self.lanes.append(priority)
+            await acquire(priority)
+
+        self.service.rate_limiter.acquire = record
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        self._config.stop()
+
+
+class TestBatchPriority(WeatherServiceTestCase):
+    async def test_batch_defaults_to_background_lane(self):
+        results = [result async for result in self.service.get_weather_many(["Paris", "Lima", "Cebu"])]
+
+        self.assertEqual(sorted(result.city for result in results), ["Cebu", "Lima", "Paris"])
+        self.assertEqual(self.lanes, [PRIORITY_BACKGROUND] * 3)
+
+    async def test_batch_can_opt_into_interactive_lane(self):
+        async for _ in self.service.get_weather_many(["Paris"], priority=PRIORITY_INTERACTIVE):
+            pass
+        self.assertEqual(self.lanes, [PRIORITY_INTERACTIVE])
+
+    async def test_single_lookup_stays_interactive(self):
+        await self.service.get_weather("Paris")
+        self.assertEqual(self.lanes, [PRIORITY_INTERACTIVE])
+
+    async def test_batch_respects_concurrency(self):
+        self.api.delay = 0.05
+        running = peak = 0
+        handle = self.api.handle
+
+        async def counting(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await handle(request)
+            finally:
+                running -= 1
+
+        self.api.handle = counting
+        await self.service.aclose()
+        self.api.install(self.service)
+        cities = [f"City {i}" for i in range(12)]
+        results = [result async for result in self.service.get_weather_many(cities, concurrency=3)]
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(peak, 3)
+
+
+class TestSingleFlight(WeatherServiceTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.api.delay = 0.1
+        self.aborted = 0
+        handle = self.api.handle
+
+        async def tracking(request):
+            try:
+                return await handle(request)
+            except asyncio.CancelledError:
+                self.aborted += 1
+                raise
+
+        self.api.handle = tracking
+        await self.service.aclose()
+        self.api.install(self.service)
+
+    def lookup(self, city: str = "Paris") -> asyncio.Task:
+        return asyncio.ensure_future(self.service.get_weather(city))
+
+    async def test_concurrent_calls_share_one_request(self):
+        results = await asyncio.gather(*(self.service.get_weather("Paris") for _ in range(5)))
+
+        self.assertEqual(self.api.count, 1)
+        self.assertEqual(self.service.coalesced_requests, 4)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.service.stats["inflight"], 0)
+
+    async def test_different_keys_do_not_coalesce(self):
+        await asyncio.gather(self.service.get_weather("Paris"), self.service.get_weather("Lima"))
+        self.assertEqual(self.api.count, 2)
+        self.assertEqual(self.service.coalesced_requests, 0)
+
+    async def test_cancelling_one_waiter_keeps_the_flight(self):
+        first, second = self.lookup(), self.lookup()
+        await settle(0.02)
+        first.cancel()
+
+        result = await second
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(result.name, "Paris")
+        self.assertEqual(self.api.count, 1)
+        self.assertEqual(self.aborted, 0)
+
+    async def test_cancelling_the_last_waiter_cancels_the_request(self):
+        waiter = self.lookup()
+        await settle(0.02)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        await settle()
+
+        self.assertEqual(self.aborted, 1)
+        self.assertEqual(self.service.stats["inflight"], 0)
+        self.assertIsNone(self.service.peek_weather("Paris"))
+
+    async def test_call_after_abort_starts_a_fresh_flight(self):
+        waiter = self.lookup()
+        await settle(0.02)
+        # Queued right behind the cancellation: the aborted task is still unwinding
+        waiter.cancel()
+        fresh = self.lookup()
+
+        result = await fresh
+        self.assertEqual(result.name, "Paris")
+        self.assertEqual(self.api.count, 2)
+        self.assertEqual(self.service.coalesced_requests, 0)
+        self.assertEqual(self.aborted, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Light and dark style tables, built once at import and shared."""
+
+from typing import NamedTuple, Optional
+
+import flet as ft
+
+
+class ThemeTokens(NamedTuple):
+    """Colors and styles for one theme mode."""
+    page_bg: str
+    card_bg: str
+    card_shadow: Optional[ft.BoxShadow]
+    text: str
+    empty_card_bg: str  # weather card before the first search
+    button_bg: str
+    button_icon: str
+    search_view_bg: str
+    error_bg: str
+    error_border: ft.Border
+    error_text: str
+    error_icon: str
+
+
+CARD_SHADOW = ft.BoxShadow(
+    blur_radius=10,
+    spread_radius=0,
+    color=ft.Colors.with_opacity(0.08, ft.Colors.BLACK),
+    offset=ft.Offset(0, 4)
+)
+
+LIGHT = ThemeTokens(
+    page_bg=ft.Colors.WHITE,
+    card_bg=ft.Colors.WHITE,
+    card_shadow=CARD_SHADOW,
+    text=ft.Colors.BLUE_900,
+    empty_card_bg=ft.Colors.BLUE_50,
+    button_bg=ft.Colors.BLUE_50,
+    button_icon=ft.Colors.BLUE_700,
+    search_view_bg=ft.Colors.WHITE,
+    error_bg=ft.Colors.RED_50,
+    error_border=ft.border.all(1, ft.Colors.RED_200),
+    error_text=ft.Colors.RED_900,
+    error_icon=ft.Colors.RED_700,
+)
+
+DARK = ThemeTokens(
+    page_bg="#121212",
+    card_bg="#212529",
+    card_shadow=None,
+    text=ft.Colors.WHITE,
+    empty_card_bg="#212529",
+    button_bg="#212529",
+    button_icon=ft.Colors.WHITE,
+    search_view_bg="#212529",
+    error_bg="#3E1A1A",  # Dark Red
+    error_border=ft.border.all(1, "#EF5350"),
+    error_text="#FFCDD2",  # Light Red Text
+    error_icon="#EF5350",
+)
+
+
+def _gradient(start: str, end: str) -> ft.LinearGradient:
+    return ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=[start, end])
+
+
+# Weather card gradients per condition; shared instances, never mutate them
+LIGHT_GRADIENTS = {
+    "Clear": _gradient(ft.Colors.LIGHT_BLUE_200, ft.Colors.BLUE_400),
+    "Clouds": _gradient(ft.Colors.BLUE_GREY_100, ft.Colors.BLUE_GREY_400),
+    "Rain": _gradient(ft.Colors.BLUE_GREY_400, ft.Colors.GREY_700),
+    "Snow": _gradient(ft.Colors.WHITE, ft.Colors.LIGHT_BLUE_100),
+    "Thunderstorm": _gradient(ft.Colors.DEEP_PURPLE_700, ft.Colors.GREY_900),
+    "Drizzle": _gradient(ft.Colors.LIGHT_BLUE_200, ft.Colors.BLUE_GREY_200),
+    "Mist": _gradient(ft.Colors.GREY_300, ft.Colors.GREY_500),
+    "Haze": _gradient(ft.Colors.GREY_300, ft.Colors.GREY_500),
+}
+
+DARK_GRADIENTS = {
+    "Clear": _gradient("#1A237E", "#311B92"),
+    "Clouds": _gradient("#455A64", "#263238"),
+    "Rain": _gradient("#37474F", "#102027"),
+    "Snow": _gradient("#78909C", "#455A64"),
+    "Thunderstorm": _gradient("#212121", "#000000"),
+    "Drizzle": _gradient("#37474F", "#263238"),
+    "Mist": _gradient("#546E7A", "#37474F"),
+    "Haze": _gradient("#546E7A", "#37474F"),
+}
+
+
+def tokens(dark: bool) -> ThemeTokens:
+    return DARK if dark else LIGHT
+
+
+def weather_gradient(condition: str, dark: bool) -> ft.LinearGradient:
+    """Gradient for a weather condition, falling back to "Clear"."""
+    gradients = DARK_GRADIENTS if dark else LIGHT_GRADIENTS
+    return gradients.get(condition, gradients["Clear"])
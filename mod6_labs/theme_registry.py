@@ -0,0 +1,46 @@
+"""Weakly-held registry of controls that follow the light/dark theme."""
+
+import weakref
+from typing import List, Optional
+
+import flet as ft
+
+
+class ThemeRegistry:
+    """
+    Tracks themed texts and cards without keeping them alive.
+
+    Controls dropped from the page are garbage collected and disappear from
+    the registry on their own; apply() also skips any that are still alive
+    but no longer mounted.
+    """
+
+    def __init__(self):
+        self._texts: "weakref.WeakSet[ft.Text]" = weakref.WeakSet()
+        self._cards: "weakref.WeakSet[ft.Container]" = weakref.WeakSet()
+
+    def add_text(self, text: ft.Text) -> ft.Text:
+        self._texts.add(text)
+        return text
+
+    def add_card(self, card: ft.Container) -> ft.Container:
+        self._cards.add(card)
+        return card
+
+    def apply(self, text_color: str, card_bg: str,
+              card_shadow: Optional[ft.BoxShadow]) -> List[ft.Control]:
+        """Set theme tokens on mounted controls and return the ones changed."""
+        changed = []
+        for text in list(self._texts):
+            if text.page is not None and text.color != text_color:
+                text.color = text_color
+                changed.append(text)
+        for card in list(self._cards):
+            if card.page is not None and (card.bgcolor != card_bg or card.shadow is not card_shadow):
+                card.bgcolor = card_bg
+                card.shadow = card_shadow
+                changed.append(card)
+        return changed
+
+    def __len__(self) -> int:
+        return len(self._texts) + len(self._cards)
@@ -0,0 +1,48 @@
+"""Instrumentation of the updates WeatherApp sends to the Flet client."""
+
+import json
+
+import flet as ft
+from flet.core.protocol import CommandEncoder
+
+
+class UIMetrics:
+    """
+    Counts update round trips, controls created and patch bytes.
+
+    attach() wraps the page's connection, so every page.update() and
+    control.update() is measured without touching the call sites.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.updates = 0
+        self.controls_created = 0
+        self.patch_bytes = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "updates": self.updates,
+            "controls_created": self.controls_created,
+            "patch_bytes": self.patch_bytes,
+        }
+
+    def attach(self, page: ft.Page):
+        conn = getattr(page, "_Page__conn", None)
+        if conn is None:
+            return
+
+        send_commands = conn.send_commands
+
+        def measured_send_commands(session_id, commands):
+            if any(command.name != "get" for command in commands):
+                self.updates += 1
+            for command in commands:
+                if command.name == "add":
+                    self.controls_created += len(command.commands)
+            self.patch_bytes += len(json.dumps(commands, cls=CommandEncoder))
+            return send_commands(session_id, commands)
+
+        conn.send_commands = measured_send_commands
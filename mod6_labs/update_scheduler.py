@@ -0,0 +1,84 @@
+"""Coalesces page/control updates into one push per event-loop tick."""
+
+import threading
+from typing import Dict, Optional
+
+import flet as ft
+
+
+class UpdateScheduler:
+    """
+    Collects dirty controls and flushes them with a single page.update().
+
+    mark() may be called from the event loop or from Flet's handler
+    threads; the flush always runs on the page's loop, after the current
+    tick's work, so several marks in a row cost one round trip.
+    """
+
+    def __init__(self, page: ft.Page, budget: int = 0):
+        self.page = page
+        self.budget = budget  # max updates per action, 0 disables the check
+        self._lock = threading.Lock()
+        self._dirty: Dict[int, ft.Control] = {}
+        self._full = False
+        self._scheduled = False
+
+        # Statistics
+        self.sent = 0
+        self.action: Optional[str] = None
+        self.action_id = 0
+        self.action_updates = 0
+        self.per_action: Dict[str, int] = {}  # last update count of each action
+
+    def mark(self, *controls: ft.Control):
+        """Queue controls for the next flush; no arguments means the whole page."""
+        with self._lock:
+            if controls:
+                for control in controls:
+                    self._dirty[id(control)] = control
+            else:
+                self._full = True
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.page.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self):
+        with self._lock:
+            full, dirty = self._full, list(self._dirty.values())
+            self._full = False
+            self._dirty.clear()
+            self._scheduled = False
+
+        if full:
+            self.page.update()
+        else:
+            mounted = [control for control in dirty if control.page is not None]
+            if not mounted:
+                return
+            self.page.update(*mounted)
+        self.sent += 1
+        self.action_updates += 1
+
+    def begin_action(self, name: str) -> int:
+        """Start counting the updates sent on behalf of a user action; returns its id."""
+        self.action = name
+        self.action_id += 1
+        self.action_updates = 0
+        return self.action_id
+
+    def end_action(self, action_id: Optional[int] = None) -> int:
+        """
+        Record and return the update count of the current action.
+
+        With `action_id`, an action that was already replaced by a newer
+        begin_action() leaves the newer one running.
+        """
+        name, count = self.action, self.action_updates
+        if name is None or (action_id is not None and action_id != self.action_id):
+            return count
+        self.per_action[name] = count
+        self.action = None
+        if self.budget and count > self.budget:
+            print(f"UI update budget exceeded by '{name}': {count} > {self.budget}")
+        return count
@@ -1,8 +1,19 @@
 """Weather API service layer."""
 
 import httpx
-from typing import Dict, Optional
+import asyncio
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, NamedTuple, Optional, Tuple
 from config import Config
+from cache import TTLCache
+from disk_cache import DiskCache
+from resilience import CircuitBreaker, RetryPolicy
+from rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, TokenBucket
+from json_stream import JsonArrayStream
+from models import CurrentConditions, Forecast, ForecastPoint
+import codec
 
 
 class WeatherServiceError(Exception):
@@ -10,6 +21,13 @@ class WeatherServiceError(Exception):
     pass
 
 
+class CityResult(NamedTuple):
+    """Outcome of one city in a batch lookup; exactly one of data/error is set."""
+    city: str
+    data: Optional[CurrentConditions]
+    error: Optional[WeatherServiceError]
+
+
 class WeatherService:
     """Service for fetching weather data from OpenWeatherMap API."""
     
@@ -18,10 +36,106 @@ class WeatherService:
         self.base_url = Config.BASE_URL
         self.forecast_url = Config.FORECAST_URL
         self.timeout = Config.TIMEOUT
+        
+        # Payloads are turned into domain models once, at the parse boundary
+        self._parsers = {
+            self.base_url: CurrentConditions.from_payload,
+            self.forecast_url: Forecast.from_payload,
+        }
+        
+        # Shared connection pool (created lazily, reused across requests)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Response cache keyed on endpoint + normalized params
+        self.cache = TTLCache(max_entries=Config.CACHE_MAX_ENTRIES)
+        
+        # Optional persistent cache that survives restarts
+        self.disk_cache: Optional[DiskCache] = None
+        if Config.DISK_CACHE_ENABLED:
+            self.disk_cache = DiskCache(
+                Config.DISK_CACHE_PATH,
+                max_age=Config.DISK_CACHE_MAX_AGE,
+                max_entries=Config.DISK_CACHE_MAX_ENTRIES,
+            )
+        # Writes and compaction run in order on one worker thread, off the event loop
+        self._disk_executor: Optional[ThreadPoolExecutor] = None
+        self._disk_writes = set()
+        self._compaction_pending = self.disk_cache is not None
+        self._background_tasks = set()
+        
+        # Single-flight: concurrent identical requests share one round trip
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._inflight_waiters: Dict[tuple, int] = {}
+        self.coalesced_requests = 0
+        
+        # Retries and per-host circuit breakers
+        self.retry_policy = RetryPolicy(
+            attempts=Config.RETRY_ATTEMPTS,
+            base_delay=Config.RETRY_BASE_DELAY,
+            max_delay=Config.RETRY_MAX_DELAY,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+        
+        # ETag / Last-Modified validators for conditional revalidation
+        self._validators = TTLCache(max_entries=Config.CACHE_MAX_ENTRIES)
+        self.not_modified = 0
+        
+        # Client-side quota guard for the shared API key
+        self.rate_limiter = TokenBucket(
+            rate=Config.RATE_LIMIT_PER_MINUTE / 60,
+            burst=Config.RATE_LIMIT_BURST,
+        )
+    
+    async def __aenter__(self):
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=Config.HTTP2 and importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=Config.MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=Config.KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared client, the disk worker and every pooled connection."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._disk_writes:
+            await asyncio.gather(*self._disk_writes, return_exceptions=True)
+        # Both reopen on demand if the service is used again
+        if self._disk_executor is not None:
+            self._disk_executor.shutdown()
+            self._disk_executor = None
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
-    async def get_weather(self, city: str, units: Optional[str] = None) -> Dict:
+    async def get_weather(
+        self, 
+        city: str, 
+        units: Optional[str] = None, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        revalidate: bool = False
+    ) -> CurrentConditions:
         """
         Fetch weather data for a given city.
+        
+        With `revalidate`, caches are bypassed and a conditional request is
+        sent; an unchanged response returns the previously cached object.
         """
         if not city:
             raise WeatherServiceError("City name cannot be empty")
@@ -36,10 +150,51 @@ class WeatherService:
         return await self._make_request(
             self.base_url, 
             params, 
-            city_context=city
+            city_context=city,
+            ttl=Config.WEATHER_CACHE_TTL,
+            priority=priority,
+            revalidate=revalidate
         )
     
-    async def get_weather_by_coordinates(self, lat: float, lon: float) -> Dict:
+    async def get_weather_many(
+        self, 
+        cities: Iterable[str], 
+        concurrency: Optional[int] = None, 
+        units: Optional[str] = None, 
+        priority: int = PRIORITY_BACKGROUND
+    ) -> AsyncIterator[CityResult]:
+        """
+        Fetch weather for many cities, yielding results as they complete.
+        
+        At most `concurrency` lookups run at once. Failures are reported per
+        city in CityResult.error instead of aborting the batch. Batches use
+        the background rate-limit lane unless a caller showing the results
+        right away asks for PRIORITY_INTERACTIVE.
+        """
+        semaphore = asyncio.Semaphore(concurrency or Config.BATCH_CONCURRENCY)
+
+        async def fetch_one(city: str) -> CityResult:
+            async with semaphore:
+                try:
+                    return CityResult(city, await self.get_weather(city, units, priority), None)
+                except WeatherServiceError as e:
+                    return CityResult(city, None, e)
+
+        tasks = [asyncio.create_task(fetch_one(city)) for city in cities]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_weather_by_coordinates(
+        self, 
+        lat: float, 
+        lon: float, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        revalidate: bool = False
+    ) -> CurrentConditions:
         """
         Fetch weather data by coordinates.
         """
@@ -49,9 +204,18 @@ class WeatherService:
             "appid": self.api_key,
             "units": Config.UNITS,
         }
-        return await self._make_request(self.base_url, params)
+        return await self._make_request(
+            self.base_url, params, ttl=Config.WEATHER_CACHE_TTL, priority=priority, 
+            revalidate=revalidate
+        )
     
-    async def get_forecast(self, city: str, units: Optional[str] = None) -> Dict:
+    async def get_forecast(
+        self, 
+        city: str, 
+        units: Optional[str] = None, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        revalidate: bool = False
+    ) -> Forecast:
         """
         Get 5-day weather forecast.
         """
@@ -67,10 +231,19 @@ class WeatherService:
         return await self._make_request(
             self.forecast_url, 
             params, 
-            city_context=city
+            city_context=city,
+            ttl=Config.FORECAST_CACHE_TTL,
+            priority=priority,
+            revalidate=revalidate
         )
 
-    async def get_forecast_by_coordinates(self, lat: float, lon: float) -> Dict:
+    async def get_forecast_by_coordinates(
+        self, 
+        lat: float, 
+        lon: float, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        revalidate: bool = False
+    ) -> Forecast:
         """Fetch forecast data by coordinates."""
         params = {
             "lat": lat,
@@ -78,56 +251,449 @@ class WeatherService:
             "appid": self.api_key,
             "units": Config.UNITS,
         }
-        return await self._make_request(self.forecast_url, params)
+        return await self._make_request(
+            self.forecast_url, params, ttl=Config.FORECAST_CACHE_TTL, priority=priority, 
+            revalidate=revalidate
+        )
+
+    async def stream_forecast(
+        self, 
+        city: str, 
+        units: Optional[str] = None, 
+        url: Optional[str] = None, 
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[ForecastPoint]:
+        """
+        Yield forecast points as they arrive instead of after the full body.
+        
+        Intended for large endpoints (hourly, 16-day); pass their URL via `url`.
+        Feed the points to a ForecastAggregator created with the city's
+        timezone offset from CurrentConditions.timezone.
+        """
+        if not city:
+            raise WeatherServiceError("City name cannot be empty")
+        
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": units or Config.UNITS,
+        }
+        async for entry in self._stream_items(
+            url or self.forecast_url, params, city, priority
+        ):
+            yield ForecastPoint.from_entry(entry)
+
+    def peek_weather(self, city: str, units: Optional[str] = None) -> Optional[CurrentConditions]:
+        """Return the last-known weather for a city without touching the network."""
+        params = {"q": city, "units": units or Config.UNITS}
+        return self._peek(self.base_url, params)
+
+    def peek_forecast(self, city: str, units: Optional[str] = None) -> Optional[Forecast]:
+        """Return the last-known forecast for a city without touching the network."""
+        params = {"q": city, "units": units or Config.UNITS}
+        return self._peek(self.forecast_url, params)
+
+    def peek_weather_by_coordinates(self, lat: float, lon: float) -> Optional[CurrentConditions]:
+        """Return the last-known weather for coordinates without touching the network."""
+        params = {"lat": lat, "lon": lon, "units": Config.UNITS}
+        return self._peek(self.base_url, params)
+
+    def peek_forecast_by_coordinates(self, lat: float, lon: float) -> Optional[Forecast]:
+        """Return the last-known forecast for coordinates without touching the network."""
+        params = {"lat": lat, "lon": lon, "units": Config.UNITS}
+        return self._peek(self.forecast_url, params)
+
+    def _peek(self, url: str, params: Dict):
+        return self._peek_key(url, self._cache_key(url, params))
+
+    def _peek_key(self, url: str, key: tuple):
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if self.disk_cache is not None:
+            stored = self.disk_cache.get(key)
+            if stored is not None:
+                return self._parse(url, stored[0])
+        return None
+
+    def _parse(self, url: str, payload: Dict):
+        """Build the domain model for an endpoint's payload (raw dict if unknown)."""
+        parser = self._parsers.get(url)
+        return parser(payload) if parser else payload
+
+    @staticmethod
+    def _cache_key(url: str, params: Dict) -> tuple:
+        """Build a cache key from the endpoint and normalized params."""
+        normalized = []
+        for name, value in params.items():
+            if name == "appid":
+                continue
+            if name == "q":
+                value = " ".join(str(value).split()).lower()
+            elif name in ("lat", "lon"):
+                value = round(float(value), 4)
+            normalized.append((name, value))
+        return (url, tuple(sorted(normalized)))
 
     async def _make_request(
         self, 
         url: str, 
         params: Dict, 
-        city_context: Optional[str] = None
-    ) -> Dict:
+        city_context: Optional[str] = None,
+        ttl: float = 0,
+        priority: int = PRIORITY_INTERACTIVE,
+        revalidate: bool = False
+    ):
         """
         Helper method to handle HTTP requests and standardize error handling.
         
+        Returns the endpoint's domain model; caches and single flights share it.
+        
         Args:
             url: The API endpoint URL
             params: Query parameters
             city_context: Optional city name to provide better 404 error messages
+            ttl: Seconds to cache a successful response (0 disables caching)
+            priority: Rate limiter lane (interactive searches beat background work)
+            revalidate: Skip cache lookups and send a conditional request
+        """
+        if self._compaction_pending:
+            self._compaction_pending = False
+            self._write_to_disk(self.disk_cache.compact)
+        
+        key = self._cache_key(url, params)
+        if ttl and not revalidate:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            
+            if self.disk_cache is not None:
+                stored = self.disk_cache.get(key)
+                if stored is not None:
+                    payload, fetched_at = stored
+                    data = self._parse(url, payload)
+                    age = time.time() - fetched_at
+                    if age < ttl:
+                        self.cache.set(key, data, ttl - age)
+                        return data
+                    if age < ttl + Config.STALE_WHILE_REVALIDATE:
+                        # Serve stale data now and refresh it in the background
+                        self._revalidate(key, url, params, city_context, ttl)
+                        return data
+        
+        return await self._fetch_and_store(
+            key, url, params, city_context, ttl, priority, revalidate
+        )
+
+    @property
+    def stats(self) -> Dict:
+        """Counters for verifying cache and coalescing savings."""
+        return {
+            "cache": self.cache.stats,
+            "coalesced": self.coalesced_requests,
+            "inflight": len(self._inflight),
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "breakers": {host: b.stats for host, b in self._breakers.items()},
+            "rate_limiter": self.rate_limiter.stats,
+        }
+
+    async def _fetch_and_store(
+        self, 
+        key: tuple, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str], 
+        ttl: float, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        revalidate: bool = False
+    ):
+        """Fetch through a single flight shared by all concurrent callers of `key`."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_cache(
+                    key, url, params, city_context, ttl, priority, revalidate
+                )
+            )
+            self._inflight[key] = task
+            self._inflight_waiters[key] = 0
+            task.add_done_callback(lambda _: self._release_flight(key, task))
+        else:
+            self.coalesced_requests += 1
+
+        self._inflight_waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Abort the shared request only when nobody is waiting on it anymore
+            if not task.done() and self._inflight_waiters.get(key) == 1:
+                task.cancel()
+                # New callers must start a fresh flight, not join the aborted one
+                self._release_flight(key, task)
+            raise
+        finally:
+            if key in self._inflight_waiters and self._inflight.get(key) is task:
+                self._inflight_waiters[key] -= 1
+
+    def _release_flight(self, key: tuple, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._inflight_waiters[key]
+
+    async def _fetch_and_cache(
+        self, 
+        key: tuple, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str], 
+        ttl: float, 
+        priority: int, 
+        revalidate: bool
+    ):
+        previous = None
+        headers = None
+        if revalidate:
+            previous = self._peek_key(url, key)
+            if previous is not None:
+                headers = self._validators.get(key)
+        
+        payload, response_headers = await self._fetch(
+            url, params, city_context, priority, headers
+        )
+        
+        if payload is None:
+            # 304 Not Modified: keep serving the object we already have
+            self.not_modified += 1
+            if ttl:
+                self.cache.set(key, previous, ttl)
+                if self.disk_cache is not None:
+                    self._write_to_disk(self.disk_cache.touch, key)
+            return previous
+        
+        validators = {}
+        if "ETag" in response_headers:
+            validators["If-None-Match"] = response_headers["ETag"]
+        if "Last-Modified" in response_headers:
+            validators["If-Modified-Since"] = response_headers["Last-Modified"]
+        if validators:
+            self._validators.set(key, validators, Config.DISK_CACHE_MAX_AGE)
+        
+        data = self._parse(url, payload)
+        if ttl:
+            self.cache.set(key, data, ttl)
+            if self.disk_cache is not None:
+                self._write_to_disk(self.disk_cache.set, key, payload)
+        return data
+
+    def _write_to_disk(self, write, *args):
+        """Queue a disk cache write on the disk worker without waiting for it."""
+        if self._disk_executor is None:
+            self._disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        future = asyncio.get_running_loop().run_in_executor(self._disk_executor, write, *args)
+        self._disk_writes.add(future)
+        future.add_done_callback(self._disk_write_done)
+
+    def _disk_write_done(self, future: asyncio.Future):
+        self._disk_writes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Disk cache write failed: {future.exception()}")
+
+    def _revalidate(
+        self, 
+        key: tuple, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str], 
+        ttl: float
+    ):
+        """Schedule a background refresh of a stale entry."""
+        async def refresh():
+            try:
+                await self._fetch_and_store(
+                    key, url, params, city_context, ttl, PRIORITY_BACKGROUND, True
+                )
+            except WeatherServiceError as e:
+                print(f"Background refresh failed: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _breaker_for(self, url: str) -> CircuitBreaker:
+        host = httpx.URL(url).host
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=Config.CIRCUIT_RESET_TIMEOUT,
+            )
+            self._breakers[host] = breaker
+        return breaker
+
+    async def _fetch(
+        self, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str] = None, 
+        priority: int = PRIORITY_INTERACTIVE, 
+        headers: Optional[Dict] = None
+    ) -> Tuple[Optional[Dict], httpx.Headers]:
         """
+        Perform the HTTP GET with retries, behind the host's circuit breaker.
+        
+        Returns (payload, response headers); payload is None on 304 Not Modified.
+        """
+        breaker = self._breaker_for(url)
+        attempt = 0
+        
+        while True:
+            if not breaker.allow_request():
+                raise WeatherServiceError(
+                    "Weather service is temporarily unavailable. Please try again shortly."
+                )
+            
+            try:
+                await self.rate_limiter.acquire(priority)
+                return await self._fetch_once(url, params, city_context, breaker, headers)
+            except _RetryableError as e:
+                breaker.record_failure()
+                delay = self.retry_policy.delay(attempt, e.retry_after)
+                if delay is None:
+                    raise e.error
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _fetch_once(
+        self, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str], 
+        breaker: CircuitBreaker, 
+        headers: Optional[Dict] = None
+    ) -> Tuple[Optional[Dict], httpx.Headers]:
+        """Single HTTP attempt; transient failures raise _RetryableError."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                # Handle specific HTTP status codes
-                if response.status_code == 404:
-                    msg = (f"City '{city_context}' not found. Please check the spelling." 
-                           if city_context else "Location not found.")
-                    raise WeatherServiceError(msg)
-                    
-                elif response.status_code == 401:
-                    raise WeatherServiceError(
-                        "Invalid API key. Please check your configuration."
-                    )
-                
-                elif response.status_code >= 500:
-                    raise WeatherServiceError(
-                        "Weather service is currently unavailable. Please try again later."
-                    )
-                
-                elif response.status_code != 200:
-                    raise WeatherServiceError(f"Error: {response.status_code}")
-                
-                return response.json()
-                
-        except httpx.TimeoutException:
-            raise WeatherServiceError(
+            response = await self._get_client().get(url, params=params, headers=headers)
+        except Exception as e:
+            raise self._transport_error(e, breaker)
+        
+        if response.status_code == 304 and headers:
+            breaker.record_success()
+            return None, response.headers
+        
+        self._check_status(response, city_context, breaker)
+        
+        try:
+            return codec.loads(response.content), response.headers
+        except ValueError as e:
+            raise WeatherServiceError(f"An unexpected error occurred: {str(e)}")
+
+    @staticmethod
+    def _transport_error(e: Exception, breaker: CircuitBreaker) -> Exception:
+        """Map an exception raised while talking to the server."""
+        if isinstance(e, httpx.TimeoutException):
+            return _RetryableError(WeatherServiceError(
                 "Request timed out. Please check your internet connection."
+            ))
+        if isinstance(e, httpx.NetworkError):
+            return _RetryableError(WeatherServiceError(
+                "Network error. Please check your internet connection."
+            ))
+        
+        breaker.release()
+        if isinstance(e, httpx.HTTPError):
+            return WeatherServiceError(f"HTTP error occurred: {str(e)}")
+        return WeatherServiceError(f"An unexpected error occurred: {str(e)}")
+
+    @staticmethod
+    def _check_status(
+        response: httpx.Response, 
+        city_context: Optional[str], 
+        breaker: CircuitBreaker
+    ):
+        """Raise for any non-200 status; transient ones raise _RetryableError."""
+        if response.status_code == 429:
+            raise _RetryableError(
+                WeatherServiceError("Too many requests. Please wait a moment and try again."),
+                RetryPolicy.parse_retry_after(response.headers.get("Retry-After")),
+            )
+        
+        elif response.status_code >= 500:
+            raise _RetryableError(WeatherServiceError(
+                "Weather service is currently unavailable. Please try again later."
+            ))
+        
+        # Any other answer means the upstream is healthy
+        breaker.record_success()
+        
+        if response.status_code == 404:
+            msg = (f"City '{city_context}' not found. Please check the spelling." 
+                   if city_context else "Location not found.")
+            raise WeatherServiceError(msg)
+            
+        elif response.status_code == 401:
+            raise WeatherServiceError(
+                "Invalid API key. Please check your configuration."
             )
-        except httpx.NetworkError:
+        
+        elif response.status_code != 200:
+            raise WeatherServiceError(f"Error: {response.status_code}")
+
+    async def _stream_items(
+        self, 
+        url: str, 
+        params: Dict, 
+        city_context: Optional[str], 
+        priority: int
+    ) -> AsyncIterator[Dict]:
+        """
+        GET `url` and yield entries of its "list" array while the body downloads.
+        
+        Streams are not cached or retried once bytes have been handed out.
+        """
+        breaker = self._breaker_for(url)
+        if not breaker.allow_request():
             raise WeatherServiceError(
-                "Network error. Please check your internet connection."
+                "Weather service is temporarily unavailable. Please try again shortly."
             )
-        except httpx.HTTPError as e:
-            raise WeatherServiceError(f"HTTP error occurred: {str(e)}")
+        
+        parser = JsonArrayStream("list")
+        try:
+            await self.rate_limiter.acquire(priority)
+            async with self._get_client().stream("GET", url, params=params) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                self._check_status(response, city_context, breaker)
+                
+                async for chunk in response.aiter_bytes():
+                    for item in parser.feed(chunk):
+                        yield item
+        except _RetryableError as e:
+            breaker.record_failure()
+            raise e.error
+        except (WeatherServiceError, asyncio.CancelledError, GeneratorExit):
+            breaker.release()
+            raise
+        except ValueError as e:
+            raise WeatherServiceError(f"An unexpected error occurred: {str(e)}")
         except Exception as e:
-            raise WeatherServiceError(f"An unexpected error occurred: {str(e)}")
\ No newline at end of file
+            error = self._transport_error(e, breaker)
+            if isinstance(error, _RetryableError):
+                breaker.record_failure()
+                raise error.error
+            raise error
+
+
+class _RetryableError(Exception):
+    """Internal signal that a request failed transiently and may be retried."""
+    
+    def __init__(self, error: WeatherServiceError, retry_after: Optional[float] = None):
+        super().__init__(str(error))
+        self.error = error
+        self.retry_after = retry_after
@@ -1,6 +1,7 @@
 # app_logic.py
 import flet as ft
 from database import update_contact_db, delete_contact_db, add_contact_db, get_all_contacts_db
+from theme_palette import tokens
 
 def validate_contact_fields(field, field_name, field_val, page):
     """Validates the contact fields with custom validation logic."""
@@ -50,10 +51,10 @@ def display_contacts(page, contacts_list_view, db_conn, search_query=""):
     contacts = sorted(contacts, key=lambda x: x[1].lower())
     
     # Determine theme colors
-    is_dark = page.theme_mode == ft.ThemeMode.DARK
-    card_bg = "#192536" if is_dark else "#E3F2FD"
-    text_color = ft.Colors.WHITE if is_dark else ft.Colors.BLACK
-    icon_color = "#1d7ed3" if is_dark else "#1976D2"
+    palette = tokens(page)
+    card_bg = palette.card_bg
+    text_color = palette.card_text
+    icon_color = palette.card_icon
 
     for contact in contacts:
         contact_id, name, phone, email = contact
@@ -340,6 +341,7 @@ def toggle_theme(page, ui_elements, e):
 def update_theme_colors(page, ui_elements):
     """Update all UI element colors based on current theme mode"""
     is_dark = page.theme_mode == ft.ThemeMode.DARK
+    palette = tokens(page)
     
     # Unpack UI elements
     (appbar, appbar_title, appbar_icon, theme_button, 
@@ -350,15 +352,15 @@ def update_theme_colors(page, ui_elements):
      contacts_list_view, db_conn) = ui_elements
     
     # Update appbar colors
-    appbar.bgcolor = "#192536" if is_dark else "#1D7ED3"
-    appbar_title.color = ft.Colors.WHITE if is_dark else ft.Colors.WHITE
-    appbar_icon.color = ft.Colors.WHITE if is_dark else ft.Colors.WHITE
-    theme_button.icon_color = ft.Colors.WHITE if is_dark else ft.Colors.WHITE
+    appbar.bgcolor = palette.appbar_bg
+    appbar_title.color = palette.appbar_fg
+    appbar_icon.color = palette.appbar_fg
+    theme_button.icon_color = palette.appbar_fg
     theme_button.icon = ft.Icons.DARK_MODE if is_dark else ft.Icons.LIGHT_MODE
     
     # Update text input colors
-    input_bg = "white" if is_dark else "white"
-    input_text_color = "black" if is_dark else "black"
+    input_bg = palette.input_bg
+    input_text_color = palette.input_text
     
     for input_field in [name_input, phone_input, email_input]:
         input_field.bgcolor = input_bg
@@ -369,18 +371,18 @@ def update_theme_colors(page, ui_elements):
     search_input.color = input_text_color
     
     # Update add contact section
-    add_contact_container.bgcolor = "#1D7ED3" if is_dark else "#E3F2FD"
-    add_contact_title.color = ft.Colors.WHITE if is_dark else "#1976D2"
+    add_contact_container.bgcolor = palette.add_contact_bg
+    add_contact_title.color = palette.add_contact_title
     
     # Update all contacts header
-    all_contacts_container.bgcolor = "#192536" if is_dark else "#E3F2FD"
-    all_contacts_text.color = ft.Colors.WHITE if is_dark else "#1976D2"
-    all_contacts_icon.color = ft.Colors.WHITE if is_dark else "#1976D2"
+    all_contacts_container.bgcolor = palette.header_bg
+    all_contacts_text.color = palette.header_fg
+    all_contacts_icon.color = palette.header_fg
     
     # Update search button
-    search_button_container.bgcolor = ft.Colors.with_opacity(0.1, ft.Colors.WHITE) if is_dark else ft.Colors.with_opacity(0.1, ft.Colors.BLACK)
-    search_text.color = ft.Colors.BLUE_GREY_300 if is_dark else ft.Colors.BLUE_GREY_600
-    search_icon.color = ft.Colors.BLUE_GREY_300 if is_dark else ft.Colors.BLUE_GREY_600
+    search_button_container.bgcolor = palette.search_bg
+    search_text.color = palette.search_fg
+    search_icon.color = palette.search_fg
     
     # Refresh contacts display
     display_contacts(page, contacts_list_view, db_conn)
@@ -0,0 +1,60 @@
+# theme_palette.py
+"""Light and dark color tables for the contact book, built once at import."""
+from typing import NamedTuple
+
+import flet as ft
+
+
+class ThemeTokens(NamedTuple):
+    """Colors for one theme mode."""
+    appbar_bg: str
+    appbar_fg: str
+    input_bg: str
+    input_text: str
+    add_contact_bg: str
+    add_contact_title: str
+    header_bg: str
+    header_fg: str
+    search_bg: str
+    search_fg: str
+    card_bg: str
+    card_text: str
+    card_icon: str
+
+
+LIGHT = ThemeTokens(
+    appbar_bg="#1D7ED3",
+    appbar_fg=ft.Colors.WHITE,
+    input_bg="white",
+    input_text="black",
+    add_contact_bg="#E3F2FD",
+    add_contact_title="#1976D2",
+    header_bg="#E3F2FD",
+    header_fg="#1976D2",
+    search_bg=ft.Colors.with_opacity(0.1, ft.Colors.BLACK),
+    search_fg=ft.Colors.BLUE_GREY_600,
+    card_bg="#E3F2FD",
+    card_text=ft.Colors.BLACK,
+    card_icon="#1976D2",
+)
+
+DARK = ThemeTokens(
+    appbar_bg="#192536",
+    appbar_fg=ft.Colors.WHITE,
+    input_bg="white",
+    input_text="black",
+    add_contact_bg="#1D7ED3",
+    add_contact_title=ft.Colors.WHITE,
+    header_bg="#192536",
+    header_fg=ft.Colors.WHITE,
+    search_bg=ft.Colors.with_opacity(0.1, ft.Colors.WHITE),
+    search_fg=ft.Colors.BLUE_GREY_300,
+    card_bg="#192536",
+    card_text=ft.Colors.WHITE,
+    card_icon="#1d7ed3",
+)
+
+
+def tokens(page):
+    """Return the color table for the page's current theme mode."""
+    return DARK if page.theme_mode == ft.ThemeMode.DARK else LIGHT